@@ -2,7 +2,10 @@ from PyQt6.QtCore import QPropertyAnimation, QPoint, QEasingCurve, QAbstractAnim
 from PyQt6.QtWidgets import QLabel
 from typing import Optional
 
-from flim_components.styles.animations_styles import AnimationsStyles
+from flim_components.styles.animations_styles import (
+    VIBRANT_LABEL_START_STYLE,
+    VIBRANT_LABEL_STOP_STYLE,
+)
 
 class VibrantLabel:
     """
@@ -66,7 +69,7 @@ class VibrantLabel:
         self._update_stylesheet(
             self.start_stylesheet
             if self.start_stylesheet is not None
-            else AnimationsStyles.vibrant_label_start_style()
+            else VIBRANT_LABEL_START_STYLE
         )
 
         self.animation.setDuration(duration)
@@ -85,7 +88,7 @@ class VibrantLabel:
             self._update_stylesheet(
                 self.stop_stylesheet
                 if self.stop_stylesheet is not None
-                else AnimationsStyles.vibrant_label_stop_style()
+                else VIBRANT_LABEL_STOP_STYLE
             )
             self.animation.stop()
             self.widget.move(self.original_pos)
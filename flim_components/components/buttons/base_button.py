@@ -187,7 +187,9 @@ class BaseButton(QPushButton):
         stylesheet : str
             The stylesheet string to be applied to the button.
         """
-        self.setStyleSheet(stylesheet)
+        # Skip Qt's stylesheet re-parse and re-polish when nothing changed
+        if stylesheet != self.styleSheet():
+            self.setStyleSheet(stylesheet)
 
     def update_text_and_style(self, text: str, stylesheet: str):
         """
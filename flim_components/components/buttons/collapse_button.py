@@ -3,7 +3,7 @@ from typing import Optional
 from PyQt6.QtCore import QPropertyAnimation, QTimer
 
 from flim_components.components.buttons.base_button import BaseButton
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.styles.buttons_styles import ButtonStyles
 
 
@@ -35,7 +35,7 @@ class CollapseButton(QWidget):
         self.expanded_icon = expanded_icon
         self.collapsed_icon = collapsed_icon
 
-        self.layout = CompactLayout(QHBoxLayout()) 
+        self.layout = compact(QHBoxLayout()) 
         self.collapse_button = self._build_button(
             self.expanded_icon,
             icon_size,
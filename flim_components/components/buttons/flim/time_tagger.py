@@ -2,7 +2,7 @@ from PyQt6.QtWidgets import QWidget, QHBoxLayout, QLabel, QCheckBox, QVBoxLayout
 from typing import Callable, Optional
 from PyQt6.QtCore import Qt
 from PyQt6.QtGui import QPixmap
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.styles.buttons_styles import ButtonStyles
 from flim_components.utils.resource_path import get_asset_path
 
@@ -90,7 +90,7 @@ class TimeTaggerButton(QWidget):
         layout.addWidget(self.time_tagger_checkbox)
         layout.addWidget(icon)
         self.container.setLayout(layout)
-        main_layout = CompactLayout(QVBoxLayout())
+        main_layout = compact(QVBoxLayout())
         main_layout.addWidget(self.container)
         self.setLayout(main_layout)
         self.set_style(bg_color, fg_color, checkbox_color, border_color)
@@ -3,7 +3,7 @@ from typing import List, Optional
 from PyQt6.QtCore import pyqtSignal
 
 from flim_components.components.buttons.base_button import BaseButton
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.models.models import Toggleable
 from flim_components.styles.buttons_styles import ButtonStyles
 
@@ -95,13 +95,13 @@ class Tabs(QWidget):
 
         self.tabs: List[BaseButton] = []
 
-        self.layout = CompactLayout(QVBoxLayout())
+        self.layout = compact(QVBoxLayout())
         self.tabs_layout = self._build_tabs()
         self.layout.addLayout(self.tabs_layout)
         self.setLayout(self.layout)
 
     def _build_tabs(self) -> QHBoxLayout:
-        tabs_layout = CompactLayout(QHBoxLayout())
+        tabs_layout = compact(QHBoxLayout())
         for i, tab_config in enumerate(self.tabs_config):
             tab = self._build_tab(tab_config)
             tabs_layout.addWidget(tab)
@@ -3,7 +3,7 @@ from typing import List, Optional
 from PyQt6.QtCore import pyqtSignal
 
 from flim_components.components.buttons.base_button import BaseButton
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.models.models import Toggleable
 from flim_components.styles.buttons_styles import ButtonStyles
 
@@ -66,11 +66,17 @@ class ToggleButton(QWidget):
         self.bg_color_active = bg_color_active
         self.bg_color_inactive = bg_color_inactive
         self.buttons: List[BaseButton] = []
+        # One stylesheet for all the child buttons, so toggling never re-parses it
+        self.setStyleSheet(
+            ButtonStyles.toggle_button_group_style(
+                fg_color_active, fg_color_inactive, bg_color_active, bg_color_inactive
+            )
+        )
         self.buttons_row_layout = self._build_buttons()
         self.setLayout(self.buttons_row_layout)
 
     def _build_buttons(self) -> QHBoxLayout:
-        buttons_row_layout = CompactLayout(QHBoxLayout()) 
+        buttons_row_layout = compact(QHBoxLayout()) 
         for i, toggleable in enumerate(self.toggleables):
             is_first = i == 0
             is_last = i == len(self.toggleables) - 1
@@ -83,22 +89,16 @@ class ToggleButton(QWidget):
     def _build_button(
         self, toggleable: Toggleable, is_first: bool, is_last: bool
     ) -> BaseButton:
-        fg_color = (
-            self.fg_color_active if toggleable["active"] else self.fg_color_inactive
-        )
-        bg_color = (
-            self.bg_color_active if toggleable["active"] else self.bg_color_inactive
-        )
         button = BaseButton(
             text=toggleable["text"],
             width=None,
             height=None,
             enabled=self.enabled,
             visible=self.visible,
-            stylesheet=ButtonStyles.toggle_button_style(
-                fg_color, bg_color, is_first, is_last
-            ),
+            stylesheet="",
         )
+        button.setProperty("first", is_first)
+        button.setProperty("last", is_last)
         button.setCheckable(True)
         button.setChecked(toggleable["active"])
         button.clicked.connect(
@@ -115,19 +115,8 @@ class ToggleButton(QWidget):
             else:
                 toggleable["active"] = False
                 button.setChecked(False)
-            is_first = i == 0
-            is_last = i == len(self.toggleables) - 1
-            self._set_style(button, is_first, is_last)
         self.toggled.emit(key)
 
-    def _set_style(self, button: BaseButton, is_first: bool, is_last: bool):
-        button_active = button.isChecked()
-        fg_color = self.fg_color_active if button_active else self.fg_color_inactive
-        bg_color = self.bg_color_active if button_active else self.bg_color_inactive
-        button.set_style(
-            ButtonStyles.toggle_button_style(fg_color, bg_color, is_first, is_last)
-        )
-
     def get_active_button(self) -> Optional[str]:
         """
         Get the key of the currently active child button.
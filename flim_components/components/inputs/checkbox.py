@@ -4,7 +4,7 @@ from PyQt6.QtWidgets import QWidget, QCheckBox, QHBoxLayout, QVBoxLayout, QLabel
 from PyQt6.QtCore import Qt
 
 from flim_components.components.inputs.fancy_checkbox import PaintedCheckbox
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.styles.inputs_styles import InputStyles
 
 
@@ -98,7 +98,7 @@ class Checkbox(QWidget):
         self.checkbox.setCursor(Qt.CursorShape.PointingHandCursor)
         self.set_style(self.stylesheet)
         self.checkbox.stateChanged.connect(self._on_state_changed)
-        layout = CompactLayout(QHBoxLayout())
+        layout = compact(QHBoxLayout())
         layout.addWidget(self.checkbox)
         self.setLayout(layout)
 
@@ -324,7 +324,7 @@ class WrappedCheckbox(QWidget):
         row = QHBoxLayout()
         row.addWidget(self.checkbox)
         self.wrapper.setLayout(row)
-        vbox = CompactLayout(QVBoxLayout())
+        vbox = compact(QVBoxLayout())
         vbox.addWidget(self.wrapper)
         self.setLayout(vbox)
         
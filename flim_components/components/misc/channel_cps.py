@@ -4,7 +4,7 @@ from PyQt6.QtGui import QPixmap
 from typing import Literal
 
 from flim_components.components.misc.cps_counter import CPSCounter
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.styles.cps_counter_styles import CPSCounterStyles
 from flim_components.utils.resource_path import get_asset_path
 
@@ -57,7 +57,7 @@ class ChannelCPS(QWidget):
     ):
         super().__init__(parent)
         self.wrapper = QWidget()
-        self.compact_layout = CompactLayout(QVBoxLayout())
+        self.compact_layout = compact(QVBoxLayout())
         self.layout_type = layout_type
         self.layout = QHBoxLayout() if layout_type == "horizontal" else QVBoxLayout()
 
@@ -1,7 +1,7 @@
 from PyQt6.QtWidgets import QWidget, QLabel, QHBoxLayout
 from typing import Optional
 from flim_components.components.buttons.base_button import BaseButton
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.styles.check_card_styles import CheckCardStyles
 from flim_components.utils.resource_path import get_asset_path
 
@@ -68,7 +68,7 @@ class CheckCardWidget(QWidget):
     ) -> None:
         super().__init__(parent)
 
-        self.layout = CompactLayout(QHBoxLayout())
+        self.layout = compact(QHBoxLayout())
         if button_icon is None:
             button_icon = get_asset_path("assets/card-icon.png")
 
@@ -2,7 +2,7 @@ from PyQt6.QtWidgets import QWidget, QLabel, QApplication, QVBoxLayout
 from typing import Dict, Optional
 
 from flim_components.components.animations.vibrant_animation import VibrantLabel
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 from flim_components.styles.cps_counter_styles import CPSCounterStyles
 from flim_components.utils.data_converter import DataConverter
 
@@ -41,7 +41,7 @@ class CPSCounter(QWidget):
         parent: Optional[QWidget] = None,
     ) -> None:
         super().__init__(parent)
-        self.layout = CompactLayout(QVBoxLayout())
+        self.layout = compact(QVBoxLayout())
         self.label_text = label_text
         self.cps_threshold_animation = cps_threshold_animation
         self.animation = None
@@ -2,7 +2,7 @@ import sys
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
 
 from flim_components.components.misc.check_card import CheckCardWidget
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 
 
 class CheckCardWidgetExampleWindow(QWidget):
@@ -18,7 +18,7 @@ class CheckCardWidgetExampleWindow(QWidget):
         
         widget_container = QWidget()
         widget_container.setFixedHeight(50)
-        container_layout = CompactLayout(QVBoxLayout())
+        container_layout = compact(QVBoxLayout())
         self.check_card_widget = CheckCardWidget(button_height=50)
         self.check_card_widget.check_button.clicked.connect(self.update_card_status)
         container_layout.addWidget(self.check_card_widget)
@@ -1,26 +1,44 @@
 
 import sys
+from typing import List, NamedTuple
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtGui import QColor, QPalette
 
 from flim_components.components.buttons.tab_buttons import Tabs
+from flim_components.models.models import Toggleable
+
+
+class TabSpec(NamedTuple):
+    text: str
+    key: str
+    active: bool
+
+
+# Frozen tab definitions; Tabs updates the "active" flag of its config,
+# so each window gets its own fresh dicts built from these specs
+TABS = (
+    TabSpec("Tab 1", "tab1", True),
+    TabSpec("Tab 2", "tab2", False),
+    TabSpec("Tab 3", "tab3", False),
+)
+
 
 class TabsExampleWindow(QWidget):
     def __init__(self):
         super().__init__()
 
         self.setWindowTitle("Tabs Example")
-        self.setStyleSheet("background-color: #121212;")  
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor("#121212"))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
         self.setFixedSize(400, 400) 
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter) 
 
-        tabs_config = [
-            {"text": "Tab 1", "key": "tab1", "active": True},
-            {"text": "Tab 2", "key": "tab2", "active": False},
-            {"text": "Tab 3", "key": "tab3", "active": False},
-        ]
+        tabs_config: List[Toggleable] = [tab._asdict() for tab in TABS]
 
         tabs = Tabs(
             tabs_config=tabs_config,
@@ -45,6 +63,7 @@ class TabsExampleWindow(QWidget):
 
         tabs.active.connect(self.on_tab_active)
 
+    @pyqtSlot(str)
     def on_tab_active(self, key: str):
         print(f"Active tab: {key}")
 
@@ -1,6 +1,13 @@
 import sys
-from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
-from PyQt6.QtCore import QTimer
+from PyQt6.QtWidgets import (
+    QApplication,
+    QWidget,
+    QVBoxLayout,
+    QSpacerItem,
+    QSizePolicy,
+)
+from PyQt6.QtCore import Qt, QTimer, pyqtSlot
+from PyQt6.QtGui import QColor, QPalette
 
 from flim_components.components.buttons.base_button import BaseButton
 from flim_components.components.misc.time_counter import TimeCounter
@@ -14,7 +21,11 @@ class TimeCounterExampleWindow(QWidget):
 
     def init_ui(self):
         self.setWindowTitle("Time Counter Widget Example")
-        self.setStyleSheet("background-color: #121212; color: white;")
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor("#121212"))
+        palette.setColor(QPalette.ColorRole.WindowText, QColor("white"))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
 
         layout = QVBoxLayout()
 
@@ -29,9 +40,13 @@ class TimeCounterExampleWindow(QWidget):
             font_size="20px"
         )
         
-        self.countdown_timer = QTimer(self)
-        self.countdown_timer.setInterval(100)  # Update every 100ms
-        self.countdown_timer.timeout.connect(self.update_countdown)
+        # A single shared timer ticks every running counter
+        self.countdown_running = False
+        self.countup_running = False
+        self.timer = QTimer(self)
+        self.timer.setTimerType(Qt.TimerType.CoarseTimer)
+        self.timer.setInterval(100)  # Update every 100ms
+        self.timer.timeout.connect(self.tick)
 
         # Start Countdown Button
         self.start_countdown_button = BaseButton(
@@ -56,10 +71,6 @@ class TimeCounterExampleWindow(QWidget):
             font_size="20px"
         )
 
-        self.countup_timer = QTimer(self)
-        self.countup_timer.setInterval(100)  # Update every 100ms
-        self.countup_timer.timeout.connect(self.update_countup)
-
         # Start Countup Button
         self.start_countup_button = BaseButton(
             text="Start Countup", 
@@ -75,28 +86,43 @@ class TimeCounterExampleWindow(QWidget):
         # Add widgets to layout
         layout.addWidget(self.countdown_label)
         layout.addWidget(self.start_countdown_button)
-        layout.addSpacing(20)
+        layout.addItem(
+            QSpacerItem(0, 20, QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Fixed)
+        )
         layout.addWidget(self.countup_label)
         layout.addWidget(self.start_countup_button)
         
         layout.addStretch(1)
         self.setLayout(layout)
 
+    @pyqtSlot()
+    def tick(self):
+        if self.countdown_running:
+            self.update_countdown()
+        if self.countup_running:
+            self.update_countup()
+        if not (self.countdown_running or self.countup_running):
+            self.timer.stop()
+
+    @pyqtSlot()
     def start_countdown(self):
         self.start_time = 0  # Reset starting time
-        self.countdown_timer.start()
+        self.countdown_running = True
+        self.timer.start()
 
     def update_countdown(self):
         # Simulate elapsed time (count in ms)
         self.start_time += 100  # Increment by 100 ms each tick
         self.countdown_label.update_count(self.start_time)
-        # Stop the timer if the countdown is complete
+        # Stop counting down once the countdown is complete
         if self.countdown_label.text().startswith("Countdown: 00:00:000"):
-            self.countdown_timer.stop()
+            self.countdown_running = False
 
+    @pyqtSlot()
     def start_countup(self):
         self.elapsed_time = 0  # Reset elapsed time
-        self.countup_timer.start()
+        self.countup_running = True
+        self.timer.start()
 
     def update_countup(self):
         # Simulate elapsed time (count in ms)
@@ -2,7 +2,8 @@
 import sys
 
 from PyQt6.QtWidgets import QApplication, QWidget, QHBoxLayout
-from PyQt6.QtCore import Qt
+from PyQt6.QtCore import Qt, pyqtSlot
+from PyQt6.QtGui import QColor, QPalette
 
 from flim_components.components.buttons.flim.time_tagger import TimeTaggerButton
 
@@ -12,17 +13,19 @@ class TimeTaggerExampleWindow(QWidget):
         super().__init__()
 
         self.setWindowTitle("Time Tagger Example")
-        self.setStyleSheet("background-color: #121212;")  
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor("#121212"))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
         self.setFixedSize(400, 400) 
         layout = QHBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter) 
         time_tagger_widget = TimeTaggerButton( event_callback=self.on_time_tagger_toggled)
-        layout.addStretch()
         layout.addWidget(time_tagger_widget)
-        layout.addStretch()
         layout.setContentsMargins(10,10,10,10)
         self.setLayout(layout)
         
+    @pyqtSlot(bool)
     def on_time_tagger_toggled(self, checked: bool):
         status = "active" if checked else "inactive"
         print(f"Time tagger {status}")
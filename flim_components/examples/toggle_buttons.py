@@ -1,10 +1,27 @@
 
 import sys
+from typing import List, NamedTuple
 
 from PyQt6.QtWidgets import QApplication, QWidget, QVBoxLayout
 from PyQt6.QtCore import Qt
+from PyQt6.QtGui import QColor, QPalette
 
 from flim_components.components.buttons.toggle_button import ToggleButton
+from flim_components.models.models import Toggleable
+
+
+class ToggleableSpec(NamedTuple):
+    text: str
+    key: str
+    active: bool
+
+
+# Frozen button definitions; ToggleButton updates the "active" flag of its
+# toggleables, so each window gets its own fresh dicts built from these specs
+TOGGLEABLES = (
+    ToggleableSpec("Button 1", "btn1", True),
+    ToggleableSpec("Button 2", "btn2", False),
+)
 
 
 class ToggleButtonsExampleWindow(QWidget):
@@ -12,15 +29,17 @@ class ToggleButtonsExampleWindow(QWidget):
         super().__init__()
 
         self.setWindowTitle("Toggle Button Example")
-        self.setStyleSheet("background-color: #121212;")  
+        palette = self.palette()
+        palette.setColor(QPalette.ColorRole.Window, QColor("#121212"))
+        self.setPalette(palette)
+        self.setAutoFillBackground(True)
         self.setFixedSize(400, 400) 
 
         layout = QVBoxLayout(self)
         layout.setAlignment(Qt.AlignmentFlag.AlignCenter) 
   
-        toggleables = [
-            {"text": "Button 1", "key": "btn1", "active": True},
-            {"text": "Button 2", "key": "btn2", "active": False},
+        toggleables: List[Toggleable] = [
+            toggleable._asdict() for toggleable in TOGGLEABLES
         ]
 
         toggle_button = ToggleButton(
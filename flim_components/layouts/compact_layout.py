@@ -1,87 +1,24 @@
-from PyQt6.QtWidgets import QLayout, QLayoutItem, QWidget
-from PyQt6.QtCore import QSize, QRect
+from PyQt6.QtWidgets import QLayout
 
-class CompactLayout(QLayout):
-    """
-    A compact layout that extends QLayout and applies compact settings
-    by setting its spacing and content margins to 0.
-    """
-
-    def __init__(self, layout: QLayout):
-        super().__init__()
-        self.layout = layout
-        self._apply_compact_settings()
-
-    def _apply_compact_settings(self):
-        """
-        Apply compact settings to the layout, setting spacing and content margins to 0.
-        """
-        self.layout.setSpacing(0)
-        self.layout.setContentsMargins(0, 0, 0, 0)
-        
-    def addSpacing(self, spacing: int) -> None:
-        """
-        Add spacing to the layout.
-        """
-        self.layout.addSpacing(spacing)      
-        
-    def addStretch(self, stretch: int) -> None:
-        """
-        Add stretch to the layout.
-        """
-        self.layout.addStretch(stretch)             
-
-    def addItem(self, item: QLayoutItem) -> None:
-        """
-        Add a layout item to the layout.
-        """
-        self.layout.addItem(item)
 
-    def itemAt(self, index: int) -> QLayoutItem | None:
-        """
-        Get the layout item at the given index.
-        """
-        return self.layout.itemAt(index)
-
-    def takeAt(self, index: int) -> QLayoutItem | None:
-        """
-        Take the layout item at the given index.
-        """
-        return self.layout.takeAt(index)
-
-    def setGeometry(self, rect: QRect) -> None:
-        """
-        Set the geometry of the layout.
-        """
-        super().setGeometry(rect)
-        self.layout.setGeometry(rect)
-
-    def sizeHint(self) -> QSize:
-        """
-        Return the size hint of the layout.
-        """
-        return self.layout.sizeHint()
+def compact(layout: QLayout) -> QLayout:
+    """
+    Apply compact settings to a layout in place, setting its spacing and content margins to 0.
 
-    def minimumSize(self) -> QSize:
-        """
-        Return the minimum size of the layout.
-        """
-        return self.layout.minimumSize()
+    Parameters
+    ----------
+    layout : QLayout
+        The layout to compact.
 
-    def addWidget(self, widget: QWidget) -> None:
-        """
-        Add a widget to the layout.
-        """
-        self.layout.addWidget(widget)
+    Returns
+    -------
+    QLayout
+        The same layout, so the call can wrap the layout construction.
+    """
+    layout.setSpacing(0)
+    layout.setContentsMargins(0, 0, 0, 0)
+    return layout
 
-    def addLayout(self, layout: QLayout) -> None:
-        """
-        Add a layout to the layout.
-        """
-        self.layout.addLayout(layout)
 
-    def count(self) -> int:
-        """
-        Return the number of items in the layout.
-        """
-        return self.layout.count()
\ No newline at end of file
+# Backward-compatible name for the former QLayout wrapper class
+CompactLayout = compact
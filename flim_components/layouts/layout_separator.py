@@ -1,7 +1,8 @@
-from typing import Literal, Optional
+from typing import Dict, Literal, Optional
 from PyQt6.QtWidgets import QWidget, QVBoxLayout, QFrame, QSizePolicy
+from PyQt6.QtCore import Qt
 
-from flim_components.layouts.compact_layout import CompactLayout
+from flim_components.layouts.compact_layout import compact
 
 class LayoutSeparator(QWidget):
     """
@@ -27,6 +28,8 @@ class LayoutSeparator(QWidget):
         The parent widget, if any. Default is None.
     """
 
+    _SEPARATOR_QSS_CACHE: Dict[str, str] = {}
+
     def __init__(
         self,
         line_width: int = 1,
@@ -38,19 +41,24 @@ class LayoutSeparator(QWidget):
         parent: Optional["QWidget"] = None,
     ):
         super().__init__(parent)
-        self.layout = CompactLayout(QVBoxLayout())
+        self.layout = compact(QVBoxLayout())
         
-        spacer = QWidget()
+        spacer = QWidget(self)
+        spacer.setAttribute(Qt.WidgetAttribute.WA_StyledBackground, True)
         spacer.setFixedSize(horizontal_space, vertical_space)
 
-        separator = QFrame()
+        separator = QFrame(self)
         if layout_type == 'horizontal':
             separator.setFrameShape(QFrame.Shape.HLine)
         else: 
             separator.setFrameShape(QFrame.Shape.VLine)    
         separator.setSizePolicy(QSizePolicy.Policy.Minimum, QSizePolicy.Policy.Minimum)
         separator.setLineWidth(line_width)
-        separator.setStyleSheet(f"QFrame{{color: {color};}}")
+        qss = self._SEPARATOR_QSS_CACHE.get(color)
+        if qss is None:
+            qss = f"QFrame{{color: {color};}}"
+            self._SEPARATOR_QSS_CACHE[color] = qss
+        separator.setStyleSheet(qss)
      
         self.layout.addWidget(spacer)
         self.layout.addWidget(separator)
@@ -1,5 +1,5 @@
 from PyQt6.QtWidgets import QWidget
-from PyQt6.QtGui import QPixmap, QPainter
+from PyQt6.QtGui import QPixmap, QPixmapCache, QPainter
 from PyQt6.QtCore import Qt
 
 
@@ -41,13 +41,29 @@ class OverlayWidget(QWidget):
         self.opacity = opacity
         self.padding_right = padding_right
         self.padding_bottom = padding_bottom
-        self.pixmap = QPixmap(self.image_path).scaledToWidth(self.image_width)
+        # Scaled pixmaps are shared through the LRU-bounded QPixmapCache
+        key = f"{self.image_path}@{self.image_width}"
+        pixmap = QPixmapCache.find(key)
+        if pixmap is None:
+            pixmap = QPixmap(self.image_path).scaledToWidth(
+                self.image_width, Qt.TransformationMode.SmoothTransformation
+            )
+            QPixmapCache.insert(key, pixmap)
+        self.pixmap = pixmap
         self.adjustSize()
+        self._update_blit_position()
+
+    def _update_blit_position(self):
+        self._blit_x = self.width() - self.pixmap.width() - self.padding_right
+        self._blit_y = self.height() - self.pixmap.height() - self.padding_bottom
+
+    def resizeEvent(self, event):
+        self._update_blit_position()
+        super().resizeEvent(event)
 
     def paintEvent(self, event):
+        # Pre-scaled pixmap blit: no antialiasing needed
         painter = QPainter(self)
-        painter.setRenderHint(QPainter.RenderHint.Antialiasing)
+        painter.setCompositionMode(QPainter.CompositionMode.CompositionMode_SourceOver)
         painter.setOpacity(self.opacity)
-        x = self.width() - self.pixmap.width() - self.padding_right
-        y = self.height() - self.pixmap.height() - self.padding_bottom
-        painter.drawPixmap(x, y, self.pixmap)
+        painter.drawPixmap(self._blit_x, self._blit_y, self.pixmap)
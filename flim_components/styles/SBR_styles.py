@@ -1,6 +1,10 @@
+from functools import lru_cache
+
+
 class SBRStyles:
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def SBR_label_style(fg_color: str, bg_color: str, font_size: str):
         return f"""
             QLabel {{
@@ -1,12 +1,12 @@
+VIBRANT_LABEL_START_STYLE = "QLabel { color: #DA1212; font-size: 30px; font-weight: bold; background-color: transparent; }"
+VIBRANT_LABEL_STOP_STYLE = "QLabel { color: #FB8C00; font-size: 30px; font-weight: bold; background-color: transparent; }"
+
+
 class AnimationsStyles:
     @staticmethod
     def vibrant_label_start_style():
-        return f"""
-            QLabel {{ color: #DA1212; font-size: 30px; font-weight: bold; background-color: transparent;}}
-        """
+        return VIBRANT_LABEL_START_STYLE
 
     @staticmethod
     def vibrant_label_stop_style():
-        return f"""
-            QLabel {{ color: #FB8C00; font-size: 30px; font-weight: bold; background-color: transparent;}}
-        """
+        return VIBRANT_LABEL_STOP_STYLE
@@ -2,6 +2,13 @@ from PyQt6.QtGui import QColor, QPalette, QFont
 from PyQt6.QtWidgets import QApplication
 from PyQt6.QtWidgets import QWidget, QLabel
 
+_APP_QSS = """
+        QLabel {
+            color: #f8f8f8;
+            font-family: "Montserrat";
+        }
+        """
+
 
 class AppThemeStyles:
    
@@ -12,14 +19,8 @@ class AppThemeStyles:
         palette.setColor(QPalette.ColorRole.Window, background_color)
         palette.setColor(QPalette.ColorRole.WindowText, fg)
         window.setPalette(palette)  
-        window.setStyleSheet(
-            """
-        QLabel {
-            color: #f8f8f8;
-            font-family: "Montserrat";
-        }
-        """
-        )  
+        if window.styleSheet() != _APP_QSS:
+            window.setStyleSheet(_APP_QSS)
 
     @staticmethod
     def set_fonts(font_name="Montserrat", font_size=10):
@@ -30,12 +31,14 @@ class AppThemeStyles:
     def set_fonts_deep(root):
         if root is None:
             return
+        thin_font = QFont("Montserrat", 14, QFont.Weight.Thin)
+        bold_font = QFont("Montserrat", 14, QFont.Weight.Bold)
+        # findChildren is already recursive, so a single call visits each descendant once
         for child in root.findChildren(QWidget):
-            if child.objectName() == "font":
-                child.setFont(QFont("Montserrat", 14, QFont.Weight.Thin))
-            if child.metaObject().className() == "QPushButton":
-                child.setFont(QFont("Montserrat", 14, QFont.Weight.Thin))
-            AppThemeStyles.set_fonts_deep(child)
-        for child in root.findChildren(QLabel):
-            child.setFont(QFont("Montserrat", 14, QFont.Weight.Bold))
-            AppThemeStyles.set_fonts_deep(child)   
\ No newline at end of file
+            if isinstance(child, QLabel):
+                child.setFont(bold_font)
+            elif (
+                child.objectName() == "font"
+                or child.metaObject().className() == "QPushButton"
+            ):
+                child.setFont(thin_font)
@@ -1,5 +1,17 @@
+from functools import lru_cache
+
+
+# Fragments shared by the push button styles, so every variant only adds its colors
+_BUTTON_TEXT_QSS = 'font-family: "Montserrat"; letter-spacing: 0.1em; font-size: 14px; font-weight: bold;'
+_BUTTON_DISABLED_QSS = (
+    "QPushButton:disabled {{ background-color: {bg_color}; "
+    "border: 2px solid {border_color}; color: {fg_color}; }}"
+)
+
+
 class ButtonStyles:
     @staticmethod
+    @lru_cache(maxsize=64)
     def base_button_style(
         fg_color: str,
         bg_color_base: str,
@@ -12,16 +24,13 @@ class ButtonStyles:
     ):
         return f"""
             QPushButton {{
+                {_BUTTON_TEXT_QSS}
                 background-color: {bg_color_base};
                 border: 1px solid {border_color};
-                font-family: "Montserrat";
                 color: {fg_color};
-                letter-spacing: 0.1em;
                 padding: 8px;
                 border-radius: 4px;
-                font-size: 14px;
-                font-weight: bold;
-            }}            
+            }}
             QPushButton:hover {{
                 background-color: {bg_color_hover};
                 border: 2px solid {bg_color_hover};
@@ -30,14 +39,15 @@ class ButtonStyles:
                 background-color: {bg_color_pressed};
                 border: 2px solid {bg_color_pressed};
             }}
-            QPushButton:disabled {{
-                background-color: {bg_color_disabled};
-                border: 2px solid {border_color_disabled};
-                color: {fg_color_disabled};
-            }}             
+            {_BUTTON_DISABLED_QSS.format(
+                bg_color=bg_color_disabled,
+                border_color=border_color_disabled,
+                fg_color=fg_color_disabled,
+            )}
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def toggle_button_style(
         fg_color: str, bg_color: str, is_first: bool = False, is_last: bool = False
     ) -> str:
@@ -56,11 +66,8 @@ class ButtonStyles:
 
         return f"""
         QPushButton {{
-            font-family: "Montserrat";
-            letter-spacing: 0.1em;
+            {_BUTTON_TEXT_QSS}
             padding: 10px 12px;
-            font-size: 14px;
-            font-weight: bold;
             min-width: 60px;
             color: {fg_color};
             background-color: {bg_color};
@@ -69,6 +76,39 @@ class ButtonStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
+    def toggle_button_group_style(
+        fg_color_active: str,
+        fg_color_inactive: str,
+        bg_color_active: str,
+        bg_color_inactive: str,
+    ) -> str:
+        # Single sheet for a whole toggle group: the active state follows :checked
+        # and the rounded ends follow the "first"/"last" dynamic properties
+        return f"""
+        QPushButton {{
+            {_BUTTON_TEXT_QSS}
+            padding: 10px 12px;
+            min-width: 60px;
+            color: {fg_color_inactive};
+            background-color: {bg_color_inactive};
+        }}
+        QPushButton:checked {{
+            color: {fg_color_active};
+            background-color: {bg_color_active};
+        }}
+        QPushButton[first="true"] {{
+            border-top-left-radius: 3px;
+            border-bottom-left-radius: 3px;
+        }}
+        QPushButton[last="true"] {{
+            border-top-right-radius: 3px;
+            border-bottom-right-radius: 3px;
+        }}
+        """
+
+    @staticmethod
+    @lru_cache(maxsize=64)
     def collapse_button_style(
         bg_color: str, border_color: str, border_radius: str, icon_size: str
     ):
@@ -82,6 +122,7 @@ class ButtonStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def select_button_style(
         fg_color: str,
         bg_color_base: str,
@@ -110,6 +151,7 @@ class ButtonStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def tab_button_style(
         fg_color: str,
         fg_color_inactive: str,
@@ -125,17 +167,14 @@ class ButtonStyles:
     ):
         return f"""
             QPushButton {{
+                {_BUTTON_TEXT_QSS}
                 background-color: {bg_color_inactive};
                 border: 1px solid transparent;
                 border-bottom: 1px solid {border_color_inactive};
-                font-family: "Montserrat";
                 color: {fg_color_inactive};
-                letter-spacing: 0.1em;
                 padding: 8px 10px;
                 border-radius: 0;
-                font-size: 14px;
-                font-weight: bold;
-            }}        
+            }}
             QPushButton:hover {{
                 background-color: {bg_color_hover};
                 border: 1px solid {bg_color_hover};
@@ -149,14 +188,15 @@ class ButtonStyles:
                 color: {fg_color};
                 border: 1px solid {border_color};
             }}    
-            QPushButton:disabled {{
-                background-color: {bg_color_disabled};
-                border: 2px solid {border_color_disabled};
-                color: {fg_color_disabled};
-            }}                          
+            {_BUTTON_DISABLED_QSS.format(
+                bg_color=bg_color_disabled,
+                border_color=border_color_disabled,
+                fg_color=fg_color_disabled,
+            )}
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def time_tagger_style(
         bg_color: str, fg_color: str, checkbox_color: str, border_color: str
     ):
@@ -1,6 +1,10 @@
+from functools import lru_cache
+
+
 class CheckCardStyles:
     
     @staticmethod
+    @lru_cache(maxsize=64)
     def message_style(color: str, bg_color: str, border_color: str):
         return f"""
             QLabel {{
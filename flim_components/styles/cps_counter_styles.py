@@ -1,8 +1,10 @@
+from functools import lru_cache
 from typing import Literal
 
 
 class CPSCounterStyles:
     @staticmethod
+    @lru_cache(maxsize=64)
     def cps_label_style():
         return """
             QLabel{
@@ -14,6 +16,7 @@ class CPSCounterStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def channel_cps_container_style(background_color: str, border_color: str):
         return f"""
             QWidget#container{{
@@ -28,6 +31,7 @@ class CPSCounterStyles:
         """
         
     @staticmethod
+    @lru_cache(maxsize=64)
     def channel_cps_label_style(layout: Literal["horizontal", "vertical"]):
         return f"""
             QLabel{{
@@ -1,6 +1,10 @@
+from functools import lru_cache
+
+
 class InputStyles:
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def input_number_style():
         return f"""
             QDoubleSpinBox, QSpinBox {{
@@ -20,6 +24,7 @@ class InputStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def input_text_style():
         return f"""
            QLineEdit, QPlainTextEdit {{
@@ -40,6 +45,7 @@ class InputStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def input_select_style():
         return f"""
             QComboBox {{
@@ -72,6 +78,7 @@ class InputStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def checkbox_style(
         checkbox_color_checked: str,
         checkbox_color_unchecked: str,
@@ -105,6 +112,7 @@ class InputStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def wrapped_checkbox_style(
         checkbox_color_checked: str, checkbox_color_unchecked: str, label_color: str
     ):
@@ -133,6 +141,7 @@ class InputStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def checkbox_wrapper_style():
         return f"""
             QWidget#wrapper {{
@@ -150,6 +159,7 @@ class InputStyles:
         """
 
     @staticmethod
+    @lru_cache(maxsize=64)
     def dual_labels_switch_style():
         return """
             QLabel {
@@ -1,8 +1,10 @@
+from functools import lru_cache
 from typing import Literal
 
 
 class LoadingStyles:
     @staticmethod
+    @lru_cache(maxsize=64)
     def loading_overlay_widget_style(
         background_color: str,
         border_color: str,
@@ -1,5 +1,9 @@
+from functools import lru_cache
+
+
 class ProgressBarStyles:
     @staticmethod
+    @lru_cache(maxsize=64)
     def progress_bar_style(color: str):
         return f"""
             QLabel {{
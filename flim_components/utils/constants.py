@@ -14,9 +14,19 @@ UNICODE_SUP = {
     "9": "\u2079",
 }
 
+UNICODE_SUP_TRANS = str.maketrans(UNICODE_SUP)
+
 PHASOR_LIFETIMES = np.array(
-    [0.1e-9, 0.5e-9, 1e-9, 2e-9, 3e-9, 4e-9, 5e-9, 6e-9, 7e-9, 8e-9, 9e-9, 10e-9]
+    [0.1e-9, 0.5e-9, 1e-9, 2e-9, 3e-9, 4e-9, 5e-9, 6e-9, 7e-9, 8e-9, 9e-9, 10e-9],
+    dtype=np.float64,
+)
+PHASOR_LIFETIMES.setflags(write=False)
+
+# Default lifetimes extended with longer taus, used at 10 and 20 MHz
+PHASOR_LIFETIMES_EXTENDED = np.concatenate(
+    (PHASOR_LIFETIMES, np.arange(10e-9, 26e-9, 5e-9))
 )
+PHASOR_LIFETIMES_EXTENDED.setflags(write=False)
 
 
-HETERODYNE_FACTOR = 255.0 / 256.0
+HETERODYNE_FACTOR = np.float64(255.0 / 256.0)
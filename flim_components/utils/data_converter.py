@@ -1,8 +1,22 @@
-from math import floor, log
+from decimal import Decimal
+from math import log10
 
 import numpy as np
 
 
+_HUMANIZE_UNITS = ("", "K", "M", "G", "T", "P")
+
+# Conversion factors to seconds and from seconds
+_TO_SECONDS = {"m": 60, "s": 1, "ms": 1e-3, "us": 1e-6, "ns": 1e-9}
+_FROM_SECONDS = {"m": 1 / 60, "s": 1, "ms": 1e3, "us": 1e6, "ns": 1e9}
+# (from_unit, to_unit) -> factor, so a conversion is one lookup and one multiply
+_TIME_FACTORS = {
+    (from_unit, to_unit): _TO_SECONDS[from_unit] * _FROM_SECONDS[to_unit]
+    for from_unit in _TO_SECONDS
+    for to_unit in _FROM_SECONDS
+}
+
+
 class DataConverter:
     """
     A utility class for converting various data types and units,
@@ -22,10 +36,8 @@ class DataConverter:
         Returns:
         - float: The equivalent frequency in MHz.
         """
-        s_value = ns_value * 1e-9
-        hz = 1 / s_value
-        mhz = hz / 1e6
-        return mhz
+        # 1 / (ns * 1e-9) / 1e6 == 1e3 / ns
+        return 1000.0 / ns_value
 
     @staticmethod
     def mhz_to_ns(mhz_value):
@@ -38,10 +50,8 @@ class DataConverter:
         Returns:
         - float: The equivalent time in nanoseconds.
         """
-        hz = mhz_value * 1e6
-        s = 1 / hz
-        ns = s * 1e9
-        return ns
+        # 1 / (MHz * 1e6) * 1e9 == 1e3 / MHz
+        return 1000.0 / mhz_value
 
     @staticmethod
     def humanize_number(number):
@@ -57,39 +67,51 @@ class DataConverter:
         """
         if number == 0:
             return "0"
-        units = ["", "K", "M", "G", "T", "P"]
-        k = 1000.0
-        magnitude = int(floor(log(number, k)))
-        scaled_number = number / k**magnitude
-        return f"{int(scaled_number)}.{str(scaled_number).split('.')[1][:2]}{units[magnitude]}"
+        sign = "-" if number < 0 else ""
+        number = abs(number)
+        # Values below 1000 have no unit suffix: skip the log10
+        if number < 1000:
+            magnitude = 0
+        else:
+            magnitude = min(int(log10(number) // 3), len(_HUMANIZE_UNITS) - 1)
+        # Scaled value truncated to two decimals, in hundredths; scaled in decimal from
+        # the shortest repr so binary float error cannot drop a digit (0.29 -> 0.28)
+        hundredths = int(Decimal(str(number)).scaleb(2 - 3 * magnitude))
+        return f"{sign}{hundredths // 100}.{hundredths % 100:02d}{_HUMANIZE_UNITS[magnitude]}"
 
     @staticmethod
-    def convert_ndarray_to_list(data):
+    def convert_ndarray_to_list(data, keep_ndarray=False):
         """
         Converts a numpy ndarray to a Python list.
 
+        `.tolist()` creates one Python object per element, so it should only be used at
+        serialization boundaries (e.g. JSON). Consumers that accept arrays should pass
+        `keep_ndarray=True` and keep working on the contiguous array (one array per
+        field rather than a list of per-element records).
+
         Parameters:
         - data (np.ndarray): The ndarray to convert.
+        - keep_ndarray (bool): If True, the ndarray is returned untouched (default is False).
 
         Returns:
-        - list: The converted list. If the input is not an ndarray, the original data is returned.
+        - list: The converted list. If the input is not an ndarray, or `keep_ndarray` is True, the original data is returned.
         """
-        if isinstance(data, np.ndarray):
+        if not keep_ndarray and isinstance(data, np.ndarray):
             return data.tolist()
         return data
 
     @staticmethod
     def convert_np_num_to_py_num(data):
         """
-        Converts numpy numeric types (e.g., np.int64, np.float64) to native Python numeric types.
+        Converts numpy scalar types (e.g., np.int32, np.int64, np.float32, np.float64) to native Python types.
 
         Parameters:
-        - data (np.int64, np.float64, or other): The numpy numeric value to convert.
+        - data (np.generic or other): The numpy scalar value to convert.
 
         Returns:
         - int or float: The equivalent Python numeric value. If the input is not a numpy type, the original data is returned.
         """
-        if isinstance(data, (np.int64, np.float64)):
+        if isinstance(data, np.generic):
             return data.item()
         return data
 
@@ -133,33 +155,9 @@ class DataConverter:
         float
             The converted value in the target unit.
         """
-
-        # Conversion factors to seconds
-        to_seconds = {
-            "m": 60,  # 1 minute = 60 seconds
-            "s": 1,  # 1 second = 1 second
-            "ms": 1e-3,  # 1 millisecond = 1/1000 seconds
-            "us": 1e-6,  # 1 microsecond = 1/1,000,000 seconds
-            "ns": 1e-9,  # 1 nanosecond = 1/1,000,000,000 seconds
-        }
-
-        # Conversion factors from seconds
-        from_seconds = {
-            "m": 1 / 60,  # 1 second = 1/60 minutes
-            "s": 1,  # 1 second = 1 second
-            "ms": 1e3,  # 1 second = 1000 milliseconds
-            "us": 1e6,  # 1 second = 1,000,000 microseconds
-            "ns": 1e9,  # 1 second = 1,000,000,000 nanoseconds
-        }
-
-        # Check if the units are valid
-        if from_unit not in to_seconds or to_unit not in from_seconds:
+        try:
+            return value * _TIME_FACTORS[(from_unit, to_unit)]
+        except KeyError:
             raise ValueError(
                 f"Unsupported unit conversion from '{from_unit}' to '{to_unit}'"
-            )
-
-        # Convert the value to seconds, then to the target unit
-        value_in_seconds = value * to_seconds[from_unit]
-        converted_value = value_in_seconds * from_seconds[to_unit]
-
-        return converted_value
+            ) from None
@@ -1,17 +1,24 @@
 import re
 from typing import Callable, List, Tuple
 
-from flim_components.utils.constants import UNICODE_SUP
+from flim_components.utils.constants import UNICODE_SUP_TRANS
+
+_NUM_RE = re.compile(r'\d+')
+
+
+def _identity(x: int) -> int:
+    return x
+
 
 class DataFormatter:
     @staticmethod
     def format_power_of_ten(i):
-        return "0" if i < 0 else f"10{''.join(UNICODE_SUP[c] for c in str(i))}"    
+        return "0" if i < 0 else "10" + str(i).translate(UNICODE_SUP_TRANS)
     
     @staticmethod
     def extract_numbers_from_text(
         text: str,
-        transform_func: Callable[[int], int] = lambda x: x
+        transform_func: Callable[[int], int] = _identity
     ) -> List[int]:
         """
         Extracts numbers from a given text and applies a transformation function to each number.
@@ -28,7 +35,9 @@ class DataFormatter:
         List[int]
             A list of integers obtained by extracting and transforming the numbers from the text.
         """
-        numbers = re.findall(r'\d+', text)  # Extract all numbers as strings
+        numbers = _NUM_RE.findall(text)  # Extract all numbers as strings
+        if transform_func is _identity:
+            return list(map(int, numbers))
         transformed_numbers = [transform_func(int(num)) for num in numbers]
         return transformed_numbers    
     
@@ -47,10 +56,10 @@ class DataFormatter:
         int
             The zero-based index of the number extracted from the label.
         """
-        numbers = DataFormatter.extract_numbers_from_text(text)
-        if not numbers:
+        match = _NUM_RE.search(text)
+        if match is None:
             raise ValueError("No number found in the text.")
-        ch_num = numbers[0]
+        ch_num = int(match.group())
         return ch_num - 1
     
     @staticmethod
@@ -1,4 +1,4 @@
-from datetime import datetime
+import time
 
 class DateTimeUtils:
     """
@@ -18,7 +18,7 @@ class DateTimeUtils:
         float
             The current timestamp as a float value.
         """
-        return datetime.now().timestamp()
+        return time.time()
     
     @staticmethod
     def calc_int_timestamp() -> int:
@@ -33,4 +33,4 @@ class DateTimeUtils:
         int
             The current timestamp as an integer value.
         """
-        return int(datetime.now().timestamp())
+        return time.time_ns() // 1_000_000_000
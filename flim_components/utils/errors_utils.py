@@ -30,23 +30,19 @@ class SpectroscopyExperimentErrors:
         Returns:
         - bool: True if an error is found, False otherwise.
         """        
-        bin_width_error = bin_width < 1000
-        frequency_mhz_error = frequency_mhz == 0.0
-        selected_channels_error = len(selected_channels) == 0
-        has_error = bin_width_error or frequency_mhz_error or selected_channels_error
-        # Bin width error message
-        if bin_width_error:
-            WarningMessage.show("Error", "Bin width value cannot be less than 1000μs")
-            return has_error
-        # Frequency mhz error message
-        if frequency_mhz_error:
-            WarningMessage.show("Error", "Frequency not detected")
-            return has_error
-        # Selected channels error message
-        if selected_channels_error:
-            WarningMessage.show("Error", "No channels selected")
-            return has_error
-        return has_error
+        checks = (
+            # Bin width error
+            (bin_width < 1000, "Bin width value cannot be less than 1000μs"),
+            # Frequency mhz error
+            (frequency_mhz == 0.0, "Frequency not detected"),
+            # Selected channels error
+            (not selected_channels, "No channels selected"),
+        )
+        for has_error, message in checks:
+            if has_error:
+                WarningMessage.show("Error", message)
+                return True
+        return False
 
 
 class PhasorExperimentErrors:
@@ -104,46 +100,26 @@ class PhasorReferenceFileErrors:
         Returns:
         - bool: True if an error is found in the reference file, False otherwise.
         """        
-        channels_error = "channels" not in reference_data
-        channels_mismatch_error = len(reference_data["channels"]) != len(
-            selected_channels
-        )
-        harmonics_error = "harmonics" not in reference_data
-        curves_error = "curves" not in reference_data
-        curves_mismatch_error = len(reference_data["curves"]) != len(selected_channels)
-        laser_period_error = "laser_period_ns" not in reference_data
-        tau_error = "tau_ns" not in reference_data
-        has_error = (
-            channels_error
-            or channels_mismatch_error
-            or harmonics_error
-            or curves_error
-            or curves_mismatch_error
-            or laser_period_error
-            or tau_error
-        )
-        # Channels error
-        if channels_error:
-            WarningMessage.show("Error", "Invalid reference file (missing channels)") 
-            return has_error
+        # Missing channels error
+        if "channels" not in reference_data:
+            WarningMessage.show("Error", "Invalid reference file (missing channels)")
+            return True
         # Channels mismatch error
-        if channels_mismatch_error:
+        if len(reference_data["channels"]) != len(selected_channels):
             WarningMessage.show("Error", "Invalid reference file (channels mismatch)")
-            return has_error
-        # Harmonics error
-        if harmonics_error:
-            WarningMessage.show("Error", "Invalid reference file (missing harmonics)")    
-            return has_error                         
-        # Curves error
-        if curves_error:
-            WarningMessage.show("Error", "Invalid reference file (missing curves)")
-            return has_error 
-        # Laser period error
-        if laser_period_error:
-            WarningMessage.show("Error", "Invalid reference file (missing laser period)")  
-            return has_error   
-        # Tau error
-        if tau_error:
-            WarningMessage.show("Error", "Invalid reference file (missing tau)")  
-            return has_error                                             
-        return has_error
+            return True
+        # Missing harmonics, curves, laser period and tau errors
+        for key, label in (
+            ("harmonics", "harmonics"),
+            ("curves", "curves"),
+            ("laser_period_ns", "laser period"),
+            ("tau_ns", "tau"),
+        ):
+            if key not in reference_data:
+                WarningMessage.show("Error", f"Invalid reference file (missing {label})")
+                return True
+        # Curves mismatch error
+        if len(reference_data["curves"]) != len(selected_channels):
+            WarningMessage.show("Error", "Invalid reference file (curves mismatch)")
+            return True
+        return False
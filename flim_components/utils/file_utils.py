@@ -2,9 +2,48 @@ import json
 import os
 import re
 import shutil
-from typing import Any, Dict
+import time
+from concurrent.futures import ThreadPoolExecutor
+from typing import Any, Callable, Dict, Hashable, List, Tuple
+import numpy as np
 from PyQt6.QtWidgets import QFileDialog
 
+try:
+    # orjson is optional; it parses bytes/bytearray headers faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+# Cached get_recent_* results, keyed on (data folder, lookup kind) and
+# storing (folder mtime ns, monotonic timestamp, result)
+_recent_cache: Dict[Tuple[str, Hashable], Tuple[int, float, Any]] = {}
+# Bounds staleness when a file is rewritten in place, which does not change
+# the folder mtime
+_RECENT_CACHE_TTL_S = 2.0
+
+# Bytes read by extract_file_metadata_field before falling back to a full parse
+_METADATA_FIELD_WINDOW = 4096
+# Compiled '"<field>":' key patterns, keyed on field name
+_metadata_field_patterns: Dict[str, "re.Pattern[bytes]"] = {}
+# Scalar JSON value (number, string, true, false or null)
+_METADATA_SCALAR = re.compile(
+    rb'-?\d+(?:\.\d+)?(?:[eE][+-]?\d+)?|"(?:[^"\\]|\\.)*"|true|false|null'
+)
+# JSON strings and brackets, to track nesting depth; a lone quote is a string cut
+# off by the end of the window
+_METADATA_TOKENS = re.compile(rb'"(?:[^"\\]|\\.)*"|[{}\[\]]|"')
+
+
+def _json_loads(data: bytes | bytearray) -> Any:
+    # orjson rejects the NaN/Infinity literals json.dump writes by default, so
+    # those documents are retried with the standard library parser
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
 
 class FileUtils:
     """
@@ -38,10 +77,74 @@ class FileUtils:
         Returns:
         - float: The absolute difference between the two file creation times, in seconds.
         """
-        ctime1 = os.path.getctime(file_path1)
-        ctime2 = os.path.getctime(file_path2)
-        time_diff = abs(ctime1 - ctime2)
-        return time_diff
+        # Subtract the integer nanosecond timestamps, converting to seconds once
+        ctime1 = os.stat(file_path1).st_ctime_ns
+        ctime2 = os.stat(file_path2).st_ctime_ns
+        return abs(ctime1 - ctime2) / 1e9
+
+    @staticmethod
+    def invalidate_recent_cache() -> None:
+        """
+        Clears the cached results of the `get_recent_*` lookups.
+        """
+        _recent_cache.clear()
+
+    @staticmethod
+    def _cached_scan(
+        data_folder: str, kind: Hashable, scan: Callable[[], Any]
+    ) -> Any:
+        """
+        Returns the cached result of `scan` for (`data_folder`, `kind`) while the
+        folder's mtime is unchanged and the entry is younger than the TTL,
+        re-running `scan` otherwise.
+        """
+        dir_mtime_ns = os.stat(data_folder).st_mtime_ns
+        key = (data_folder, kind)
+        cached = _recent_cache.get(key)
+        now = time.monotonic()
+        if (
+            cached is not None
+            and cached[0] == dir_mtime_ns
+            and now - cached[1] < _RECENT_CACHE_TTL_S
+        ):
+            return cached[2]
+        result = scan()
+        _recent_cache[key] = (dir_mtime_ns, now, result)
+        return result
+
+    @staticmethod
+    def _scan_mtimes(
+        data_folder: str, predicate: Callable[[str], bool]
+    ) -> Tuple[List[str], np.ndarray]:
+        """
+        Scans `data_folder` once and returns the paths of the files whose name
+        satisfies `predicate`, together with an int64 array of their mtimes (ns).
+        """
+        with os.scandir(data_folder) as entries:
+            matches = [entry for entry in entries if predicate(entry.name)]
+        mtimes = np.fromiter(
+            (entry.stat(follow_symlinks=False).st_mtime_ns for entry in matches),
+            dtype=np.int64,
+            count=len(matches),
+        )
+        return [entry.path for entry in matches], mtimes
+
+    @staticmethod
+    def _most_recent(
+        data_folder: str, kind: str, predicate: Callable[[str], bool]
+    ) -> str | None:
+        """
+        Returns the path of the most recently modified file in `data_folder`
+        whose name satisfies `predicate`, or None if no file matches.
+        """
+
+        def scan() -> str | None:
+            paths, mtimes = FileUtils._scan_mtimes(data_folder, predicate)
+            if not paths:
+                return None
+            return paths[int(np.argmax(mtimes))]
+
+        return FileUtils._cached_scan(data_folder, kind, scan)
 
     @staticmethod
     def get_recent_spectroscopy_file(root_folder: str) -> str:
@@ -56,19 +159,16 @@ class FileUtils:
         - str: The path to the most recent spectroscopy file.
         """
         data_folder = os.path.join(root_folder, ".flim-labs", "data")
-        files = [
-            f
-            for f in os.listdir(data_folder)
-            if f.startswith("spectroscopy")
-            and not ("calibration" in f)
-            and not ("phasors" in f)
-        ]
-        if not files:
-            raise FileNotFoundError("No spectroscopy files found.")
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
+        file_path = FileUtils._most_recent(
+            data_folder,
+            "spectroscopy",
+            lambda f: f.startswith("spectroscopy")
+            and "calibration" not in f
+            and "phasors" not in f,
         )
-        return os.path.join(data_folder, files[0])
+        if file_path is None:
+            raise FileNotFoundError("No spectroscopy files found.")
+        return file_path
 
     @staticmethod
     def get_recent_phasors_file(root_folder: str) -> str:
@@ -83,17 +183,14 @@ class FileUtils:
         - str: The path to the most recent phasors file.
         """
         data_folder = os.path.join(root_folder, ".flim-labs", "data")
-        files = [
-            f
-            for f in os.listdir(data_folder)
-            if f.startswith("spectroscopy-phasors") and not ("calibration" in f)
-        ]
-        if not files:
-            raise FileNotFoundError("No suitable phasors file found.")
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
+        file_path = FileUtils._most_recent(
+            data_folder,
+            "phasors",
+            lambda f: f.startswith("spectroscopy-phasors") and "calibration" not in f,
         )
-        return os.path.join(data_folder, files[0])
+        if file_path is None:
+            raise FileNotFoundError("No suitable phasors file found.")
+        return file_path
 
     @staticmethod
     def get_recent_intensity_tracing_file(root_folder: str) -> str:
@@ -108,15 +205,12 @@ class FileUtils:
         - str: The path to the most recent intensity tracing file.
         """
         data_folder = os.path.join(root_folder, ".flim-labs", "data")
-        files = [
-            f for f in os.listdir(data_folder) if f.startswith("intensity-tracing")
-        ]
-        if not files:
-            raise FileNotFoundError("No intensity tracing files found.")
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
+        file_path = FileUtils._most_recent(
+            data_folder, "intensity-tracing", lambda f: f.startswith("intensity-tracing")
         )
-        return os.path.join(data_folder, files[0])
+        if file_path is None:
+            raise FileNotFoundError("No intensity tracing files found.")
+        return file_path
 
     @staticmethod
     def get_recent_n_intensity_tracing_files(num: int, root_folder: str) -> str:
@@ -132,13 +226,22 @@ class FileUtils:
         - List[str]: A list of paths to the 'n' most recent intensity tracing files.
         """
         data_folder = os.path.join(root_folder, ".flim-labs", "data", "fcs-intensity")
-        files = [
-            f for f in os.listdir(data_folder) if f.startswith("intensity-tracing")
-        ]
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
-        )
-        return [os.path.join(data_folder, f) for f in files[:num]]
+
+        def scan() -> List[str]:
+            paths, mtimes = FileUtils._scan_mtimes(
+                data_folder, lambda f: f.startswith("intensity-tracing")
+            )
+            if num <= 0 or not paths:
+                return []
+            top = np.arange(len(paths))
+            if num < len(paths):
+                top = np.argpartition(mtimes, -num)[-num:]
+            # Newest first
+            top = top[np.argsort(mtimes[top])[::-1]]
+            return [paths[i] for i in top]
+
+        # Copy so callers cannot mutate the cached list
+        return list(FileUtils._cached_scan(data_folder, ("n-intensity-tracing", num), scan))
 
     @staticmethod
     def get_recent_fcs_file(root_folder: str) -> str:
@@ -156,17 +259,14 @@ class FileUtils:
         - FileNotFoundError: If no FCS files are found.
         """
         data_folder = os.path.join(root_folder, ".flim-labs", "data")
-        files = [
-            f
-            for f in os.listdir(data_folder)
-            if f.startswith("fcs") and not ("calc" in f) and not ("intensity" in f)
-        ]
-        if not files:
-            raise FileNotFoundError("No FCS files found.")
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
+        file_path = FileUtils._most_recent(
+            data_folder,
+            "fcs",
+            lambda f: f.startswith("fcs") and "calc" not in f and "intensity" not in f,
         )
-        return os.path.join(data_folder, files[0])
+        if file_path is None:
+            raise FileNotFoundError("No FCS files found.")
+        return file_path
     
 
     @staticmethod
@@ -184,17 +284,12 @@ class FileUtils:
         - FileNotFoundError: If no Time Tagger files are found.
         """        
         data_folder = os.path.join(root_folder, ".flim-labs", "data")
-        files = [
-            f
-            for f in os.listdir(data_folder)
-            if f.startswith("time_tagger_spectroscopy")
-        ]
-        if not files:
-            raise FileNotFoundError("No Time Tagger files found.")        
-        files.sort(
-            key=lambda x: os.path.getmtime(os.path.join(data_folder, x)), reverse=True
+        file_path = FileUtils._most_recent(
+            data_folder, "time-tagger", lambda f: f.startswith("time_tagger_spectroscopy")
         )
-        return os.path.join(data_folder, files[0])  
+        if file_path is None:
+            raise FileNotFoundError("No Time Tagger files found.")        
+        return file_path
     
     
     @staticmethod
@@ -222,8 +317,39 @@ class FileUtils:
         origin_file_name = os.path.basename(origin_file_path)
         new_file_name = f"{save_name}_{origin_file_name}"
         new_file_path = os.path.join(save_dir, new_file_name)
-        shutil.copyfile(origin_file_path, new_file_path)
+        if not FileUtils._copy_file_range(origin_file_path, new_file_path):
+            shutil.copyfile(origin_file_path, new_file_path)
         return new_file_path
+
+    @staticmethod
+    def _copy_file_range(src_path: str, dst_path: str) -> bool:
+        """
+        Copies `src_path` to `dst_path` in-kernel with os.copy_file_range (Linux only).
+        Returns False when the fast path is unavailable, so the caller can fall back
+        to shutil.copyfile (which itself uses sendfile/fcopyfile where possible).
+        """
+        if not hasattr(os, "copy_file_range"):
+            return False
+        try:
+            # Opening dst for writing would truncate src when both are the same file;
+            # leave that case to shutil.copyfile, which raises SameFileError
+            if os.path.exists(dst_path) and os.path.samefile(src_path, dst_path):
+                return False
+            with open(src_path, "rb") as src, open(dst_path, "wb") as dst:
+                remaining = os.fstat(src.fileno()).st_size
+                # procfs/sysfs and some FUSE/overlay files report size 0 or stop
+                # early while still having content: leave them to shutil.copyfile
+                if remaining == 0:
+                    return False
+                while remaining > 0:
+                    copied = os.copy_file_range(src.fileno(), dst.fileno(), remaining)
+                    if copied == 0:
+                        break
+                    remaining -= copied
+        except OSError:
+            # e.g. EXDEV across filesystems on older kernels, or ENOSYS
+            return False
+        return remaining == 0
         
         
     @staticmethod
@@ -247,11 +373,117 @@ class FileUtils:
             A dictionary containing the metadata extracted from the file. The keys and values depend on the content of the JSON metadata.
         """
         with open(file_path, "rb") as f:
-            assert f.read(4) == magic_number
-            header_length = int.from_bytes(f.read(4), byteorder="little")
-            header = f.read(header_length)
-            metadata = json.loads(header)
+            # Magic number and header length share one 8-byte read
+            prefix = bytearray(8)
+            f.readinto(prefix)
+            assert prefix[:4] == magic_number
+            header_length = int.from_bytes(prefix[4:], byteorder="little")
+            header = bytearray(header_length)
+            f.readinto(header)
+            metadata = _json_loads(header)
         return metadata
+
+    @staticmethod
+    def extract_file_metadata_field(
+        file_path: str, magic_number: bytes, field: str, default: Any = None
+    ) -> Any:
+        """
+        Extracts a single scalar field from the metadata header of a .bin file without
+        parsing the whole JSON header.
+
+        Only the first few KiB of the file are read and scanned for the key at the top level
+        of the header object; keys of the same name in nested objects are skipped. If the
+        key is not in that window, or its value is not a scalar (number, string, boolean or
+        null), this falls back to `extract_file_metadata`.
+
+        Parameters
+        ----------
+        file_path : str
+            The path to the file from which the field will be extracted.
+        magic_number : bytes
+            A 4-byte magic number used to verify the file's format.
+        field : str
+            The name of the metadata field to extract.
+        default : Any, optional
+            The value returned if the field is not in the metadata (default is None).
+
+        Returns
+        -------
+        Any
+            The value of the field, or `default` if it is missing.
+        """
+        pattern = _metadata_field_patterns.get(field)
+        if pattern is None:
+            pattern = re.compile(rb'"' + re.escape(field.encode()) + rb'"\s*:\s*')
+            _metadata_field_patterns[field] = pattern
+        with open(file_path, "rb") as f:
+            window = f.read(_METADATA_FIELD_WINDOW)
+        assert window[:4] == magic_number
+        header_length = int.from_bytes(window[4:8], byteorder="little")
+        end = 8 + header_length
+        depth = 0
+        for token in _METADATA_TOKENS.finditer(window, 8, end):
+            start = token.start()
+            char = window[start]
+            if char == 0x22:  # '"'
+                if token.end() - start == 1:
+                    # Unterminated string: the rest of the window is not reliable
+                    break
+                if depth != 1:
+                    continue
+                key = pattern.match(window, start, end)
+                if key is None:
+                    continue
+                value = _METADATA_SCALAR.match(window, key.end(), end)
+                # A number ending exactly at the window boundary may be truncated
+                if value is not None and value.end() < len(window):
+                    return _json_loads(value.group())
+                break
+            elif char in b"{[":
+                depth += 1
+            else:
+                depth -= 1
+        metadata = FileUtils.extract_file_metadata(file_path, magic_number)
+        return metadata.get(field, default)
+
+    @staticmethod
+    def extract_file_metadata_batch(
+        file_paths: List[str], magic_number: bytes, max_workers: int | None = None
+    ) -> List[Dict[str, Any]]:
+        """
+        Extracts metadata from many .bin files, overlapping their header reads.
+
+        Each file is parsed with `extract_file_metadata` on a worker thread; file reads
+        release the GIL, so the open/read round-trips of different files run concurrently.
+
+        Parameters
+        ----------
+        file_paths : List[str]
+            The paths of the files from which metadata will be extracted.
+        magic_number : bytes
+            A 4-byte magic number used to verify each file's format.
+        max_workers : int | None, optional
+            The maximum number of worker threads (default is the ThreadPoolExecutor default).
+
+        Returns
+        -------
+        List[Dict[str, Any]]
+            The metadata of each file, in the same order as `file_paths`.
+        """
+        if len(file_paths) <= 1:
+            return [
+                FileUtils.extract_file_metadata(file_path, magic_number)
+                for file_path in file_paths
+            ]
+        with ThreadPoolExecutor(max_workers=max_workers) as executor:
+            return list(
+                executor.map(
+                    lambda file_path: FileUtils.extract_file_metadata(
+                        file_path, magic_number
+                    ),
+                    file_paths,
+                )
+            )
     
     
     @staticmethod
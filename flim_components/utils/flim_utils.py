@@ -1,10 +1,166 @@
+import math
+from functools import lru_cache
 from typing import List
 import numpy as np
 
-from flim_components.utils.constants import HETERODYNE_FACTOR, PHASOR_LIFETIMES
+from flim_components.utils.constants import (
+    HETERODYNE_FACTOR,
+    PHASOR_LIFETIMES,
+    PHASOR_LIFETIMES_EXTENDED,
+)
 from flim_components.utils.data_converter import DataConverter
 from flim_components.utils.data_formatter import DataFormatter
 
+
+def _phasor_points_g_s(
+    harmonic: int, laser_period_ns: float, tau_m: np.ndarray
+) -> tuple[np.ndarray, np.ndarray]:
+    fex = (1 / laser_period_ns) * 10e8
+    k = 1 / (2 * np.pi * harmonic * fex)
+    # With t = tau_m / k: m * cos(arctan(t)) = 1 / (1 + t^2)
+    # and m * sin(arctan(t)) = t / (1 + t^2), so no trig is needed
+    t = tau_m / k
+    denom = 1.0 + t * t
+    g = 1.0 / denom
+    s = t / denom
+    return g, s
+
+
+def _histogram2d_counts(x: np.ndarray, y: np.ndarray, n_bins: int) -> np.ndarray:
+    # Bin assignment mirrors np.histogramdd: right-open bins, the last bin also
+    # includes the upper edge, and samples outside the range are dropped
+    edges = np.linspace(-2, 2, n_bins + 1)
+    ix = np.searchsorted(edges, x, side="right")
+    iy = np.searchsorted(edges, y, side="right")
+    ix[x == edges[-1]] -= 1
+    iy[y == edges[-1]] -= 1
+    inside = (ix >= 1) & (ix <= n_bins) & (iy >= 1) & (iy <= n_bins)
+    flat = (ix[inside] - 1) * n_bins + (iy[inside] - 1)
+    counts = np.bincount(flat, minlength=n_bins * n_bins)
+    return counts.astype(np.uint32).reshape(n_bins, n_bins)
+
+
+@lru_cache(maxsize=8)
+def _bin_to_time_ns_factor(frequency_mhz: float) -> float:
+    # Nanoseconds per time bin: laser period / 256 bins, scaled by the heterodyne factor
+    if frequency_mhz == 0.0:
+        return 0.0
+    return DataConverter.mhz_to_ns(frequency_mhz) * HETERODYNE_FACTOR / 256.0
+
+
+@lru_cache(maxsize=64)
+def _default_phasor_points(
+    harmonic: int, laser_period_ns: float, frequency_mhz: float
+) -> tuple[np.ndarray, np.ndarray, np.ndarray]:
+    # Cached phasor points for the default lifetimes; the arrays are shared
+    # between callers, so they are returned read-only
+    tau_m = (
+        PHASOR_LIFETIMES_EXTENDED if frequency_mhz in [10, 20] else PHASOR_LIFETIMES
+    )
+    g, s = _phasor_points_g_s(harmonic, laser_period_ns, tau_m)
+    g.setflags(write=False)
+    s.setflags(write=False)
+    return g, s, tau_m
+
+
+class PhasorPoints:
+    """
+    A growable structure-of-arrays container for phasor points, storing the g and s
+    coordinates in two contiguous float64 buffers instead of a list of tuples.
+
+    Parameters
+    ----------
+    capacity : int, optional
+        The initial number of points the buffers can hold (default is 1024).
+    """
+
+    def __init__(self, capacity: int = 1024) -> None:
+        capacity = max(capacity, 1)
+        self._g = np.empty(capacity, dtype=np.float64)
+        self._s = np.empty(capacity, dtype=np.float64)
+        self._size = 0
+
+    @classmethod
+    def from_tuples(cls, points: list[tuple[float, float]]) -> "PhasorPoints":
+        """
+        Build a PhasorPoints container from a list of (g, s) tuples.
+
+        Parameters
+        ----------
+        points : list[tuple[float, float]]
+            The phasor points as (g, s) tuples.
+
+        Returns
+        -------
+        PhasorPoints
+            A container holding the same points.
+        """
+        values = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        phasor_points = cls(len(values))
+        phasor_points.extend(values[:, 0], values[:, 1])
+        return phasor_points
+
+    @property
+    def g(self) -> np.ndarray:
+        """The g coordinates of the stored points (a view, not a copy)."""
+        return self._g[: self._size]
+
+    @property
+    def s(self) -> np.ndarray:
+        """The s coordinates of the stored points (a view, not a copy)."""
+        return self._s[: self._size]
+
+    def __len__(self) -> int:
+        return self._size
+
+    def append(self, g: float, s: float) -> None:
+        """
+        Append a single phasor point.
+
+        Parameters
+        ----------
+        g : float
+            The g coordinate of the point.
+        s : float
+            The s coordinate of the point.
+        """
+        self._reserve(self._size + 1)
+        self._g[self._size] = g
+        self._s[self._size] = s
+        self._size += 1
+
+    def extend(self, g: np.ndarray, s: np.ndarray) -> None:
+        """
+        Append many phasor points at once.
+
+        Parameters
+        ----------
+        g : np.ndarray
+            The g coordinates of the points.
+        s : np.ndarray
+            The s coordinates of the points (same length as `g`).
+        """
+        g = np.asarray(g, dtype=np.float64).ravel()
+        s = np.asarray(s, dtype=np.float64).ravel()
+        if g.shape != s.shape:
+            raise ValueError("g and s must have the same length.")
+        end = self._size + g.size
+        self._reserve(end)
+        self._g[self._size : end] = g
+        self._s[self._size : end] = s
+        self._size = end
+
+    def _reserve(self, size: int) -> None:
+        capacity = self._g.size
+        if size <= capacity:
+            return
+        # Grow geometrically, like list, so appends stay amortized O(1)
+        while capacity < size:
+            capacity *= 2
+        self._g = np.resize(self._g, capacity)
+        self._s = np.resize(self._s, capacity)
+
+
 class FlimUtils:
     """
     A generic class for Flim utilities and calculations.
@@ -29,7 +185,7 @@ class FlimUtils:
             - log_ticks : List[tuple]
                 A list of tick labels formatted as powers of ten.
             - exponents_lin_space_int : ndarray
-                Linearly spaced integer exponents for the logarithmic scale.
+                The integer exponents from 0 to the maximum exponent, one per tick.
             - max_exponents_int : int
                 The maximum exponent found in the input values.
         """
@@ -56,23 +212,21 @@ class FlimUtils:
             - log_values : ndarray
                 The logarithmic values of the input data.
             - exponents_lin_space_int : ndarray
-                Linearly spaced integer exponents for the logarithmic scale.
+                The integer exponents from 0 to the maximum exponent, one per tick.
             - max_exponents_int : int
                 The maximum exponent found in the input values.
         """
-        values = np.array(values)
-        values = np.where(
-            values <= 0, 1e-9, values
-        )  # Avoid negative or zero values for log calculation
-        log_values = np.log10(values)
-        log_values = np.where(
-            log_values < 0, -0.1, log_values
-        )  # Adjust negative logs to a small negative value
+        # Avoid negative or zero values for log calculation; this is the only
+        # float buffer, the caller's array is never modified
+        log_values = np.maximum(np.asarray(values, dtype=np.float64), 1e-9)
+        np.log10(log_values, out=log_values)
+        # Adjust negative logs to a small negative value
+        log_values[log_values < 0] = -0.1
         exponents_int = log_values.astype(int)
-        exponents_lin_space_int = np.linspace(
-            0, max(exponents_int), len(exponents_int)
-        ).astype(int)
-        return log_values, exponents_lin_space_int, max(exponents_int)
+        max_exponents_int = int(exponents_int.max())
+        # One tick per integer exponent, independently of the number of values
+        exponents_lin_space_int = np.arange(max_exponents_int + 1, dtype=np.int32)
+        return log_values, exponents_lin_space_int, max_exponents_int
 
     @staticmethod
     def calc_log_mode_axis_ticks(int_exponents: np.ndarray):
@@ -178,14 +332,13 @@ class FlimUtils:
         """
         if freq_mhz == 0.0:
             return None, None
-        tau_phi = (1 / (2 * np.pi * freq_mhz * harmonic)) * (s / g) * 1e3
-        tau_m_component = (1 / (s**2 + g**2)) - 1
+        inv_omega = 1.0 / (2.0 * math.pi * freq_mhz * harmonic)
+        tau_phi = inv_omega * (s / g) * 1e3
+        tau_m_component = 1.0 / (s * s + g * g) - 1.0
         if tau_m_component < 0:
             tau_m = None
         else:
-            tau_m = (
-                (1 / (2 * np.pi * freq_mhz * harmonic)) * np.sqrt(tau_m_component) * 1e3
-            )
+            tau_m = inv_omega * math.sqrt(tau_m_component) * 1e3
         return tau_phi, tau_m
 
     @staticmethod
@@ -215,31 +368,28 @@ class FlimUtils:
             - g: The G values (real part of the phasor).
             - s: The S values (imaginary part of the phasor).
             - tau_m: The (possibly extended) lifetime values used in the calculation.
+            When the default lifetimes are used, the results are cached and returned as read-only arrays.
         """
+        if tau_m is PHASOR_LIFETIMES:
+            return _default_phasor_points(harmonic, laser_period_ns, frequency_mhz)
         if frequency_mhz in [10, 20]:
             additional_tau = np.arange(10e-9, 26e-9, 5e-9)
             tau_m = np.concatenate((tau_m, additional_tau))
-        fex = (1 / laser_period_ns) * 10e8
-        k = 1 / (2 * np.pi * harmonic * fex)
-        phi = np.arctan(tau_m / k)
-        factor = (tau_m / k) ** 2
-        m = np.sqrt(1 / (1 + factor))
-        g = m * np.cos(phi)
-        s = m * np.sin(phi)
+        g, s = _phasor_points_g_s(harmonic, laser_period_ns, tau_m)
         return g, s, tau_m
 
     @staticmethod
     def calculate_phasor_points_mean(
-        points: list[tuple[float, float]]
+        points: PhasorPoints | list[tuple[float, float]]
     ) -> tuple[float | None, float | None]:
         """
         Calculates the mean phasor coordinates (g, s) from a list of phasor points.
 
         Parameters:
         ----------
-        points : list[tuple[float, float]]
-            A list of tuples where each tuple contains two float values representing
-            the g and s  coordinates of a phasor point.
+        points : PhasorPoints | list[tuple[float, float]]
+            A PhasorPoints container, or a list of tuples where each tuple contains two float
+            values representing the g and s  coordinates of a phasor point.
 
         Returns:
         -------
@@ -250,19 +400,21 @@ class FlimUtils:
             - mean_s : float or None
             The mean of the s values. Returns None if input is empty or contains only NaN values.
         """
-        x = [p[0] for p in points]
-        y = [p[1] for p in points]
-        g_values = np.array(x)
-        s_values = np.array(y)
-        if (
-            g_values.size == 0
-            or s_values.size == 0
-            or np.all(np.isnan(g_values))
-            or np.all(np.isnan(s_values))
-        ):
+        if isinstance(points, PhasorPoints):
+            g_values = points.g
+            s_values = points.s
+            if (
+                g_values.size == 0
+                or np.all(np.isnan(g_values))
+                or np.all(np.isnan(s_values))
+            ):
+                return None, None
+            return np.nanmean(g_values), np.nanmean(s_values)
+        # One (N, 2) array: column 0 holds the g values, column 1 the s values
+        values = np.asarray(points, dtype=np.float64).reshape(-1, 2)
+        if values.size == 0 or np.any(np.all(np.isnan(values), axis=0)):
             return None, None
-        mean_g = np.nanmean(g_values)
-        mean_s = np.nanmean(s_values)
+        mean_g, mean_s = np.nanmean(values, axis=0)
         return mean_g, mean_s
 
     @staticmethod
@@ -284,32 +436,33 @@ class FlimUtils:
         Returns:
         -------
         h : np.ndarray
-            The normalized 2D histogram array.
-        h_min : float
-            The minimum non-zero value in the histogram.
-        h_max : float
-            The maximum value in the histogram.
+            The normalized 2D histogram array (float32, empty bins set to NaN).
+        h_min : int
+            The minimum non-zero count in the histogram.
+        h_max : int
+            The maximum count in the histogram.
         all_zeros : bool
             A flag indicating whether the histogram contains only zeros.
         """
         if not x or not y:
             return None, None, None, True  # No data to quantize
-        # Create 2D histogram
-        h, xedges, yedges = np.histogram2d(
-            x, y, bins=bins * 4, range=[[-2, 2], [-2, 2]]
+        # Create 2D histogram as integer counts (same binning as np.histogram2d
+        # over [-2, 2] x [-2, 2]), instead of a float64 histogram
+        n_bins = bins * 4
+        h = _histogram2d_counts(
+            np.asarray(x, dtype=np.float64), np.asarray(y, dtype=np.float64), n_bins
         )
-        # Check for non-zero values
-        non_zero_h = h[h > 0]
-        all_zeros = len(non_zero_h) == 0
-        if all_zeros:
-            return h, None, None, all_zeros
-        # Find the minimum and maximum values in the non-zero elements
-        h_min = np.min(non_zero_h)
-        h_max = np.max(h)
-        # Normalize the histogram
-        h = h / h_max
-        h[h == 0] = np.nan
-        return h, h_min, h_max, all_zeros
+        # Counts are non-negative, so a zero maximum means an empty histogram
+        h_max = h.max()
+        if h_max == 0:
+            return h.astype(np.float32), None, None, True
+        # Find the minimum value in the non-zero elements
+        h_min = h[h > 0].min()
+        # Normalize the histogram to float32, marking empty bins as NaN
+        h_norm = h.astype(np.float32)
+        h_norm /= h_max
+        h_norm[h == 0] = np.nan
+        return h_norm, h_min, h_max, False
 
     @staticmethod
     def create_hot_colormap() -> tuple[np.ndarray, np.ndarray]:
@@ -411,8 +564,7 @@ class FlimUtils:
         float
             The time in nanoseconds corresponding to the given bin, adjusted by the heterodyne factor.
         """
-        laser_period_ns = 0.0 if frequency_mhz == 0.0 else DataConverter.mhz_to_ns(frequency_mhz)
-        return ((bin * laser_period_ns) / 256) * HETERODYNE_FACTOR
+        return bin * _bin_to_time_ns_factor(frequency_mhz)
     
 
     @staticmethod
@@ -435,10 +587,68 @@ class FlimUtils:
         int
             The corresponding bin value for the given time in nanoseconds, adjusted by the heterodyne factor.
         """
-        laser_period_ns = 0.0 if frequency_mhz == 0.0 else DataConverter.mhz_to_ns(frequency_mhz)
-        if laser_period_ns == 0.0:
+        factor = _bin_to_time_ns_factor(frequency_mhz)
+        if factor == 0.0:
             return 0  
-        return (micro_time_ns * 256) / (HETERODYNE_FACTOR * laser_period_ns)
+        return micro_time_ns / factor
+
+    @staticmethod
+    def bin_to_time_ns_array(
+        bins: np.ndarray, frequency_mhz: float, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Convert an array of time bins to nanoseconds based on the laser frequency.
+
+        Vectorized counterpart of `bin_to_time_ns`, converting all bins in a single NumPy operation.
+
+        Parameters
+        ----------
+        bins : np.ndarray
+            The time bins to be converted into nanoseconds.
+        frequency_mhz : float
+            The modulation frequency of the laser in megahertz (MHz).
+        out : np.ndarray | None, optional
+            A float32 array with the same shape as `bins` to write the result into (default is None).
+
+        Returns
+        -------
+        np.ndarray
+            The times in nanoseconds (float32) corresponding to the given bins.
+        """
+        return np.multiply(
+            bins, _bin_to_time_ns_factor(frequency_mhz), out=out, dtype=np.float32
+        )
+
+    @staticmethod
+    def time_ns_to_bin_array(
+        micro_times_ns: np.ndarray, frequency_mhz: float, out: np.ndarray | None = None
+    ) -> np.ndarray:
+        """
+        Convert an array of times in nanoseconds to bin values based on the laser frequency.
+
+        Vectorized counterpart of `time_ns_to_bin`, converting all times in a single NumPy operation.
+
+        Parameters
+        ----------
+        micro_times_ns : np.ndarray
+            The times in nanoseconds to be converted into bin values.
+        frequency_mhz : float
+            The modulation frequency of the laser in megahertz (MHz).
+        out : np.ndarray | None, optional
+            A float32 array with the same shape as `micro_times_ns` to write the result into (default is None).
+
+        Returns
+        -------
+        np.ndarray
+            The bin values (float32) for the given times; all zeros if the frequency is 0.
+        """
+        factor = _bin_to_time_ns_factor(frequency_mhz)
+        if factor == 0.0:
+            if out is None:
+                return np.zeros(np.shape(micro_times_ns), dtype=np.float32)
+            out.fill(0)
+            return out
+        return np.divide(micro_times_ns, factor, out=out, dtype=np.float32)
     
     
     @staticmethod
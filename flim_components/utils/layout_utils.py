@@ -1,10 +1,86 @@
-
+import threading
+import weakref
+from functools import partial
+from typing import Any, Callable, Iterator, Set, Tuple
+from PyQt6 import sip
+from PyQt6.QtCore import QCoreApplication, QEvent, QObject, QThread, pyqtSignal, pyqtSlot
 from PyQt6.QtGui import QGuiApplication, QCursor
 from PyQt6.QtWidgets import QWidget, QApplication
 
 from flim_components.components.popups.popup import Popup
 
 
+# Layouts already cleared and scheduled for deletion, so repeat clears are no-ops
+_CLEARED_LAYOUTS = weakref.WeakSet()
+
+
+class _GuiThreadDispatcher(QObject):
+    """
+    Runs callables emitted from any thread on the thread the dispatcher lives in.
+    """
+
+    call = pyqtSignal(object)
+
+    def __init__(self):
+        super().__init__()
+        self.call.connect(self._run)
+
+    @pyqtSlot(object)
+    def _run(self, fn):
+        fn()
+
+
+_gui_dispatcher = None
+_gui_dispatcher_lock = threading.Lock()
+
+
+def _dispatch_to_gui_thread(fn: Callable[[], Any]) -> bool:
+    # Queue fn on the GUI thread when called from another thread; returns False
+    # (nothing queued) on the GUI thread or when there is no application
+    global _gui_dispatcher
+    app = QCoreApplication.instance()
+    if app is None or QThread.currentThread() == app.thread():
+        return False
+    with _gui_dispatcher_lock:
+        if _gui_dispatcher is None:
+            _gui_dispatcher = _GuiThreadDispatcher()
+            _gui_dispatcher.moveToThread(app.thread())
+    _gui_dispatcher.call.emit(fn)
+    return True
+
+
+class _DeferFilter(QObject):
+    """
+    Collects the updates marked dirty while a layout is hidden and replays them once,
+    on the first Show event of any of its widgets.
+    """
+
+    def __init__(self, widgets, on_show_callback: Callable[[Set[Any]], None], parent=None):
+        super().__init__(parent)
+        self._widgets = widgets
+        self._on_show_callback = on_show_callback
+        self._pending: Set[Any] = set()
+        for widget in widgets:
+            widget.installEventFilter(self)
+
+    def mark_dirty(self, kind: Any) -> None:
+        """
+        Record that the hidden content needs the update identified by `kind`.
+        """
+        self._pending.add(kind)
+
+    def eventFilter(self, obj, event):
+        if event.type() == QEvent.Type.Show:
+            for widget in self._widgets:
+                if not sip.isdeleted(widget):
+                    widget.removeEventFilter(self)
+            pending, self._pending = self._pending, set()
+            if pending:
+                self._on_show_callback(pending)
+            self.deleteLater()
+        return False
+
+
 class LayoutUtils:
     """
     A utility class providing static methods for manipulating layouts in PyQt6.
@@ -23,14 +99,10 @@ class LayoutUtils:
         Notes
         -----
         This method traverses the layout and hides all widgets contained within it.
-        It also recursively hides widgets in any nested layouts.
+        It also hides widgets in any nested layouts, repainting the parent widget once.
+        When called from a worker thread, the call is queued on the GUI thread.
         """
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item.widget():
-                item.widget().hide()
-            elif item.layout():
-                LayoutUtils.hide_layout(item.layout())
+        LayoutUtils.set_layout_visible(layout, False)
 
     @staticmethod
     def show_layout(layout):
@@ -45,17 +117,109 @@ class LayoutUtils:
         Notes
         -----
         This method traverses the layout and shows all widgets contained within it.
-        It also recursively shows widgets in any nested layouts.
+        It also shows widgets in any nested layouts, repainting the parent widget once.
+        When called from a worker thread, the call is queued on the GUI thread.
         """
-        for i in range(layout.count()):
-            item = layout.itemAt(i)
-            if item.widget():
-                item.widget().show()
-            elif item.layout():
-                LayoutUtils.show_layout(item.layout())
+        LayoutUtils.set_layout_visible(layout, True)
 
     @staticmethod
-    def clear_layout(layout):
+    def set_layout_visible(layout, visible: bool) -> None:
+        """
+        Show or hide all widgets within a given layout and its nested layouts.
+
+        Parameters
+        ----------
+        layout : QLayout
+            The layout whose widgets and nested layouts will be shown or hidden.
+        visible : bool
+            Whether to show (True) or hide (False) the widgets.
+
+        Notes
+        -----
+        Only widgets not already in the requested state are changed, with the parent
+        widget repainted once. When called from a worker thread, the call is queued
+        on the GUI thread.
+        """
+        if _dispatch_to_gui_thread(
+            partial(LayoutUtils.set_layout_visible, layout, visible)
+        ):
+            return
+        # Only widgets not already in the target state, so repeated toggles of an
+        # unchanged layout do not freeze and repaint the parent at all
+        pending = [
+            widget
+            for widget in LayoutUtils._layout_widgets(layout)
+            if widget.isHidden() == visible
+        ]
+        if not pending:
+            return
+
+        def apply(_layout):
+            for widget in pending:
+                widget.setVisible(visible)
+
+        LayoutUtils._with_updates_disabled(layout, apply)
+
+    @staticmethod
+    def walk(layout) -> Iterator[Tuple[QWidget, int]]:
+        """
+        Iterate over all widgets within a layout and its nested layouts.
+
+        Parameters
+        ----------
+        layout : QLayout
+            The layout to traverse.
+
+        Yields
+        ------
+        Tuple[QWidget, int]
+            Each widget with the nesting depth of the layout holding it (0 for `layout`
+            itself), so several actions can be applied in a single traversal.
+        """
+        stack = [(layout, 0)]
+        push = stack.append
+        while stack:
+            current, depth = stack.pop()
+            item_at = current.itemAt
+            for i in range(current.count()):
+                item = item_at(i)
+                widget = item.widget()
+                if widget is not None:
+                    yield widget, depth
+                else:
+                    sub_layout = item.layout()
+                    if sub_layout is not None:
+                        push((sub_layout, depth + 1))
+
+    @staticmethod
+    def hide_layout_deferred(
+        layout, on_show_callback: Callable[[Set[Any]], None]
+    ) -> _DeferFilter:
+        """
+        Hide all widgets within a layout and defer their updates until it is shown again.
+
+        Parameters
+        ----------
+        layout : QLayout
+            The layout whose widgets and nested layouts will be hidden.
+        on_show_callback : Callable[[Set[Any]], None]
+            Called once, when any widget of the layout is next shown, with the set of
+            update kinds marked dirty while hidden. Not called if nothing was marked.
+
+        Returns
+        -------
+        _DeferFilter
+            A handle exposing `mark_dirty(kind)`. While the layout is hidden, clients should
+            route their modification notifications through it instead of updating the
+            hidden widgets, so each kind of update runs once instead of once per change.
+        """
+        widgets = LayoutUtils._layout_widgets(layout)
+        handle = _DeferFilter(widgets, on_show_callback, layout.parentWidget())
+        LayoutUtils.set_layout_visible(layout, False)
+        return handle
+
+    @staticmethod
+    def clear_layout(layout, defer: bool = True):
         """
         Recursively remove all widgets and sub-layouts from a given layout.
 
@@ -63,24 +227,81 @@ class LayoutUtils:
         ----------
         layout : QLayout
             The layout to be cleared of all widgets and sub-layouts.
+        defer : bool, optional
+            Whether to delete the removed items through the event loop with `deleteLater()`
+            (default is True). Pass False on teardown paths to destroy them right away with
+            `sip.delete()`; this is only safe when no queued signals or events still target
+            those widgets.
 
         Notes
         -----
         This method removes and deletes all widgets and sub-layouts from the specified
         layout. It also ensures that any memory associated with the removed items is
-        properly cleaned up by calling `deleteLater()` on them.
+        properly cleaned up by calling `deleteLater()` on them, or by deleting them
+        immediately when `defer` is False. When called from a worker thread, the call
+        is queued on the GUI thread, where Qt widgets must be destroyed. Clearing a
+        layout that was already cleared does nothing.
         """
-        if layout is not None:
-            while layout.count():
-                item = layout.takeAt(0)
+        if layout is None:
+            return
+        if _dispatch_to_gui_thread(partial(LayoutUtils.clear_layout, layout, defer)):
+            return
+        if layout in _CLEARED_LAYOUTS or sip.isdeleted(layout):
+            return
+        # Freeze the parent so the whole teardown invalidates and repaints it once
+        LayoutUtils._with_updates_disabled(
+            layout, partial(LayoutUtils._clear_items, defer=defer)
+        )
+        _CLEARED_LAYOUTS.add(layout)
+
+    @staticmethod
+    def _clear_items(layout, defer: bool) -> None:
+        # Explicit worklist instead of recursion into nested layouts
+        work = [layout]
+        push = work.append
+        while work:
+            current = work.pop()
+            take = current.takeAt
+            # Take from the end so the layout never shifts its remaining items
+            for i in range(current.count() - 1, -1, -1):
+                item = take(i)
+                if item is None:
+                    continue
                 widget = item.widget()
                 if widget is not None:
-                    widget.deleteLater()
+                    if defer:
+                        widget.deleteLater()
+                    else:
+                        sip.delete(widget)
                 else:
                     sub_layout = item.layout()
                     if sub_layout is not None:
-                        LayoutUtils.clear_layout(sub_layout)
-            layout.deleteLater()
+                        push(sub_layout)
+            if defer:
+                current.deleteLater()
+            else:
+                sip.delete(current)
+
+    @staticmethod
+    def _layout_widgets(layout) -> list:
+        # Widgets of a layout and of all its nested layouts, in walk order
+        return [widget for widget, _depth in LayoutUtils.walk(layout)]
+
+    @staticmethod
+    def _with_updates_disabled(layout, fn) -> None:
+        # Suppress intermediate repaints of the parent while fn changes the children,
+        # then let Qt relayout and repaint it once
+        parent = layout.parentWidget()
+        freeze = parent is not None and parent.updatesEnabled()
+        if freeze:
+            parent.setUpdatesEnabled(False)
+        try:
+            fn(layout)
+        finally:
+            if freeze:
+                parent.setUpdatesEnabled(True)
+            if parent is not None:
+                parent.updateGeometry()
 
     @staticmethod
     def center_window(window: QWidget) -> None:
@@ -92,12 +313,8 @@ class LayoutUtils:
         window : QWidget
             The window to be centered. It must be a QWidget or subclass thereof.
         """
-        # Determine which screen to use
-        screen_number = LayoutUtils.get_current_screen()
-        if screen_number == -1:
-            screen = QGuiApplication.primaryScreen()
-        else:
-            screen = QGuiApplication.screens()[screen_number]        
+        # Use the screen under the cursor, falling back to the primary screen
+        screen = QGuiApplication.screenAt(QCursor.pos()) or QGuiApplication.primaryScreen()
         # Get the screen and window geometry
         screen_geometry = screen.geometry()
         window_geometry = window.frameGeometry()
@@ -120,12 +337,10 @@ class LayoutUtils:
         int
             The index of the screen containing the cursor, or -1 if no screen contains the cursor.
         """
-        cursor_pos = QCursor.pos()
-        screens = QGuiApplication.screens()
-        for screen_number, screen in enumerate(screens):
-            if screen.geometry().contains(cursor_pos):
-                return screen_number
-        return -1
+        screen = QGuiApplication.screenAt(QCursor.pos())
+        if screen is None:
+            return -1
+        return QGuiApplication.screens().index(screen)
     
     @staticmethod
     def close_all_popups() -> None:
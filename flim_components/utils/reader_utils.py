@@ -1,15 +1,67 @@
 import json
-from typing import Any, Callable, Optional, Tuple
+import mmap
+import os
+from functools import partial
+from typing import Any, BinaryIO, Callable, Iterator, Optional, Tuple
+import numpy as np
+from PyQt6.QtCore import QThreadPool
 from PyQt6.QtWidgets import QFileDialog
 
 from flim_components.components.popups.box_message import WarningMessage
+from flim_components.utils.tasks import ReadJsonTask, TaskSignals
+
+try:
+    # orjson is optional; it parses the raw bytes faster than json
+    import orjson
+except ImportError:
+    orjson = None
+
+try:
+    # ijson is optional; it streams a single subtree without loading the whole document
+    import ijson
+except ImportError:
+    ijson = None
+
+try:
+    # msgspec is optional; it decodes straight into typed structs when a schema is given
+    import msgspec
+except ImportError:
+    msgspec = None
+
+
+def _json_loads(data: bytes | bytearray) -> Any:
+    # orjson rejects the NaN/Infinity literals json.dump writes by default, so
+    # those documents are retried with the standard library parser
+    if orjson is not None:
+        try:
+            return orjson.loads(data)
+        except orjson.JSONDecodeError:
+            pass
+    return json.loads(data)
+
+
+def _file_dialog_options() -> QFileDialog.Option:
+    # The OS-native dialog is used by default, since Qt's own dialog stats every
+    # entry of the folder. Set FLIM_USE_QT_DIALOG=1 to get the Qt dialog back,
+    # without the per-file icon provider and symlink resolution
+    if os.environ.get("FLIM_USE_QT_DIALOG", "") not in ("", "0"):
+        return (
+            QFileDialog.Option.DontUseNativeDialog
+            | QFileDialog.Option.DontUseCustomDirectoryIcons
+            | QFileDialog.Option.DontResolveSymlinks
+        )
+    return QFileDialog.Option(0)
 
 
 class ReadFilesUtils:
     @staticmethod
     def read_json(
-        window: Any, file_type: str, filter_string: str | None = None
-    ) -> Tuple[Optional[str], Optional[dict]]:
+        window: Any,
+        file_type: str,
+        filter_string: str | None = None,
+        json_prefix: str | None = None,
+        schema: type | None = None,
+    ) -> Tuple[Optional[str], Optional[Any]]:
         """
         Opens a file dialog to select a JSON file, then reads and parses its content.
 
@@ -21,38 +73,28 @@ class ReadFilesUtils:
             A string representing the type of file to read (e.g. "Spectroscopy metadata")
         filter_string: str | None, optional
             The string which should be use to filter files (default is None).
+        json_prefix: str | None, optional
+            Dot-separated path of the only subtree to load (e.g. "metadata.channels").
+            When set, the subtree is streamed with ijson if installed, so the rest of the
+            document is never materialized (default is None, the whole document).
+        schema: type | None, optional
+            A msgspec.Struct subclass (or other msgspec type) describing the data. When set,
+            the JSON is decoded and validated straight into that type with msgspec instead
+            of returning a dict (default is None).
 
         Returns
         -------
-        Tuple[Optional[str], Optional[dict]]
-            A tuple containing the file path and the parsed JSON data. Returns (None, None)
-            if the file is invalid or an error occurs.
+        Tuple[Optional[str], Optional[Any]]
+            A tuple containing the file path and the parsed JSON data (or the requested subtree,
+            None if missing). Returns (None, None) if the file is invalid or an error occurs.
         """
-        dialog = QFileDialog()
-        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
-        if filter_string:
-            filter_pattern = f"JSON files (*{filter_string}*.json)"
-        else:
-            filter_pattern = "JSON files (*.json)"
-        dialog.setNameFilter(filter_pattern)
-        file_name, _ = dialog.getOpenFileName(
-            window,
-            f"Load {file_type} file",
-            "",
-            filter_pattern,
-            options=QFileDialog.Option.DontUseNativeDialog,
-        )
-        if not file_name:
-            return None, None
-        if file_name is not None and not file_name.endswith(".json"):
-            WarningMessage.show(
-                "Invalid extension", "Invalid extension. File should be a .json"
-            )
+        file_name = ReadFilesUtils._get_json_file_name(window, file_type, filter_string)
+        if file_name is None:
             return None, None
         try:
-            with open(file_name, "r") as f:
-                data = json.load(f)
-                return file_name, data
+            data = ReadFilesUtils.load_json_file(file_name, json_prefix, schema)
+            return file_name, data
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
         except json.JSONDecodeError:
             WarningMessage.show(
                 "Invalid JSON", "The file could not be parsed as valid JSON."
@@ -64,14 +106,115 @@ class ReadFilesUtils:
             )
             return None, None
 
+    @staticmethod
+    def read_json_async(
+        window: Any,
+        file_type: str,
+        on_done: Callable[[str, Any], None],
+        filter_string: str | None = None,
+        json_prefix: str | None = None,
+        schema: type | None = None,
+    ) -> Optional[ReadJsonTask]:
+        """
+        Opens a file dialog to select a JSON file, then parses its content on the global
+        QThreadPool so that large files do not block the GUI thread.
+
+        Parameters
+        ----------
+        window : Any
+            The parent window for the QFileDialog.
+        file_type : str
+            A string representing the type of file to read (e.g. "Spectroscopy metadata")
+        on_done : Callable[[str, Any], None]
+            The callback invoked on the GUI thread with the file path and the parsed JSON data.
+        filter_string: str | None, optional
+            The string which should be use to filter files (default is None).
+        json_prefix: str | None, optional
+            Dot-separated path of the only subtree to load (default is None, the whole document).
+        schema: type | None, optional
+            msgspec.Struct subclass (or other msgspec type) to decode into (default is None).
+
+        Returns
+        -------
+        Optional[ReadJsonTask]
+            The submitted task, or None if no valid file was selected.
+        """
+        file_name = ReadFilesUtils._get_json_file_name(window, file_type, filter_string)
+        if file_name is None:
+            return None
+        # Parented to the window so the signals outlive the task until delivery
+        signals = TaskSignals(window)
+        signals.success.connect(
+            lambda result: on_done(result["file_name"], result["data"])
+        )
+        signals.error.connect(
+            lambda error: WarningMessage.show(
+                error["title"],
+                error["message"]
+                if error["title"] == "Invalid JSON"
+                else f"Error reading {file_type} file: {error['message']}",
+            )
+        )
+        signals.success.connect(signals.deleteLater)
+        signals.error.connect(signals.deleteLater)
+        task = ReadJsonTask(
+            file_name,
+            signals,
+            partial(
+                ReadFilesUtils.load_json_file, json_prefix=json_prefix, schema=schema
+            ),
+        )
+        QThreadPool.globalInstance().start(task)
+        return task
+
+    @staticmethod
+    def load_json_file(
+        file_name: str, json_prefix: str | None = None, schema: type | None = None
+    ) -> Optional[Any]:
+        """
+        Reads and parses a JSON file, without any dialog or message box.
+
+        Parameters
+        ----------
+        file_name : str
+            The path of the JSON file to parse.
+        json_prefix: str | None, optional
+            Dot-separated path of the only subtree to load (default is None, the whole document).
+        schema: type | None, optional
+            msgspec.Struct subclass (or other msgspec type) to decode into (default is None).
+
+        Returns
+        -------
+        Optional[Any]
+            The parsed JSON data, or the requested subtree (None if missing).
+        """
+        if schema is not None and msgspec is None:
+            raise ImportError("msgspec is required to decode JSON files into a schema")
+        with open(file_name, "rb") as f:
+            if json_prefix:
+                data = ReadFilesUtils._load_json_subtree(f, json_prefix)
+                return data if schema is None else msgspec.convert(data, type=schema)
+            if schema is not None:
+                try:
+                    return msgspec.json.decode(f.read(), type=schema)
+                except msgspec.ValidationError:
+                    raise
+                except msgspec.DecodeError as e:
+                    raise json.JSONDecodeError(str(e), "", 0) from e
+            return _json_loads(f.read())
+
     @staticmethod
     def read_bin(
         window: Any,
-        magic_bytes: Optional[bytes],
+        magic_bytes: Optional[bytes | frozenset[bytes]],
         file_type: str,
         read_data_cb: Callable[..., Any],
         filter_string: str | None = None,
         *args: Any,
+        chunk_size: int = 1 << 20,
+        dtype: np.dtype | None = None,
+        count: int = -1,
+        use_mmap: bool = False,
         **kwargs: Any,
     ) -> Optional[Any]:
         """
@@ -82,17 +225,33 @@ class ReadFilesUtils:
         ----------
         window : Any
             The parent window for the QFileDialog.
-        magic_bytes : Optional[bytes]
-            The expected magic bytes for file validation. Pass None to skip validation.
+        magic_bytes : Optional[bytes | frozenset[bytes]]
+            The expected magic bytes for file validation, or a set of accepted magic bytes
+            (all of the same length) when several file variants are valid. Pass None to skip validation.
         file_type : str
             A string representing the file type (e.g. "Spectroscopy").
         filter_string: str | None, optional
             The string which should be use to filter files (default is None).
         read_data_cb : Callable[..., Any]
             The callback function to process the file data. This function must accept
-            a file object and any other required arguments passed via *args and **kwargs.
+            a file object (or a NumPy array when `dtype` is provided) and any other required
+            arguments passed via *args and **kwargs.
+            For large files, callbacks should consume the payload incrementally (e.g. with
+            `ReadFilesUtils.iter_chunks`) rather than calling `.read()` on the whole file.
         *args : Any
             Additional positional arguments to be passed to the callback.
+        chunk_size : int, optional
+            The buffer size in bytes of the file object passed to the callback (default is 1 MiB).
+        dtype : np.dtype | None, optional
+            When provided, the payload following the magic bytes is parsed with `np.fromfile`
+            and the callback receives the resulting (structured) array instead of the file
+            object (default is None).
+        count : int, optional
+            The number of `dtype` items to read when `dtype` is provided (default is -1, the whole payload).
+        use_mmap : bool, optional
+            When True, the file is memory-mapped and the callback receives a read-only memoryview
+            over the payload following the magic bytes, so large files are never copied in memory
+            (default is False). Ignored when `dtype` is provided.
         **kwargs : Any
             Additional keyword arguments to be passed to the callback.
 
@@ -101,36 +260,52 @@ class ReadFilesUtils:
         Optional[Any]
             The result of the callback function, or None if the file is invalid or an error occurs.
         """
-        dialog = QFileDialog()
-        dialog.setAcceptMode(QFileDialog.AcceptMode.AcceptOpen)
+        if magic_bytes is None or isinstance(magic_bytes, bytes):
+            expected_magic = magic_bytes
+            magic_length = len(magic_bytes) if magic_bytes is not None else 0
+        else:
+            expected_magic = frozenset(magic_bytes)
+            magic_lengths = {len(magic) for magic in expected_magic}
+            if len(magic_lengths) != 1:
+                raise ValueError("All magic bytes must have the same length.")
+            magic_length = magic_lengths.pop()
         if filter_string:
             filter_pattern = f"Bin files (*{filter_string}*.bin)"
         else:
             filter_pattern = "Bin files (*.bin)"
-        dialog.setNameFilter(filter_pattern)
-        file_name, _ = dialog.getOpenFileName(
+        file_name, _ = QFileDialog.getOpenFileName(
             window,
             f"Load {file_type} file",
             "",
             filter_pattern,
-            options=QFileDialog.Option.DontUseNativeDialog,
+            options=_file_dialog_options(),
         )
         if not file_name:
             return None
-        if file_name is not None and not file_name.endswith(".bin"):
+        if os.path.splitext(file_name)[1].lower() != ".bin":
             WarningMessage.show(
                 "Invalid extension", "Invalid extension. File should be a .bin"
             )
             return None
         try:
-            with open(file_name, "rb") as f:
-                if magic_bytes is not None and f.read(4) != magic_bytes:
+            with open(file_name, "rb", buffering=chunk_size) as f:
+                if expected_magic is not None and not ReadFilesUtils._magic_matches(
+                    f.read(magic_length), expected_magic
+                ):
                     WarningMessage.show(
                         "Invalid file",
                         f"Invalid file. The file is not a valid {file_type} file.",
                     )
                     return None
 
+                if dtype is not None:
+                    data = np.fromfile(f, dtype=dtype, count=count)
+                    return read_data_cb(data, file_name, *args, **kwargs)
+                if use_mmap:
+                    return ReadFilesUtils._call_with_mapping(
+                        f, magic_length, read_data_cb, file_name, *args, **kwargs
+                    )
+
                 # Call the callback function with the file object and additional args/kwargs
                 return read_data_cb(f, file_name, *args, **kwargs)
 
@@ -139,3 +314,93 @@ class ReadFilesUtils:
                 "Error reading file", f"Error reading {file_type} file: {str(e)}"
             )
             return None
+
+    @staticmethod
+    def iter_chunks(f: BinaryIO, chunk_size: int = 1 << 20) -> Iterator[memoryview]:
+        """
+        Iterates over the remaining content of a binary file in fixed-size chunks, so
+        large payloads can be processed without loading the whole file in memory.
+
+        Parameters
+        ----------
+        f : BinaryIO
+            The binary file object to read from (e.g. the one passed to a `read_bin` callback).
+        chunk_size : int, optional
+            The maximum size in bytes of each chunk (default is 1 MiB). Use a multiple of
+            the record size so that records are never split across chunks.
+
+        Yields
+        ------
+        memoryview
+            A view over the next chunk of bytes; the last chunk may be shorter.
+        """
+        while chunk := f.read(chunk_size):
+            yield memoryview(chunk)
+
+    @staticmethod
+    def _get_json_file_name(
+        window: Any, file_type: str, filter_string: str | None
+    ) -> Optional[str]:
+        if filter_string:
+            filter_pattern = f"JSON files (*{filter_string}*.json)"
+        else:
+            filter_pattern = "JSON files (*.json)"
+        file_name, _ = QFileDialog.getOpenFileName(
+            window,
+            f"Load {file_type} file",
+            "",
+            filter_pattern,
+            options=_file_dialog_options(),
+        )
+        if not file_name:
+            return None
+        if os.path.splitext(file_name)[1].lower() != ".json":
+            WarningMessage.show(
+                "Invalid extension", "Invalid extension. File should be a .json"
+            )
+            return None
+        return file_name
+
+    @staticmethod
+    def _load_json_subtree(f: BinaryIO, json_prefix: str) -> Optional[Any]:
+        if ijson is not None:
+            try:
+                return next(ijson.items(f, json_prefix, use_float=True), None)
+            except ijson.JSONError as e:
+                raise json.JSONDecodeError(str(e), "", 0) from e
+        data = _json_loads(f.read())
+        for key in json_prefix.split("."):
+            if not isinstance(data, dict) or key not in data:
+                return None
+            data = data[key]
+        return data
+
+    @staticmethod
+    def _magic_matches(header: bytes, expected_magic: bytes | frozenset[bytes]) -> bool:
+        if isinstance(expected_magic, frozenset):
+            return header in expected_magic
+        return header == expected_magic
+
+    @staticmethod
+    def _call_with_mapping(
+        f: BinaryIO,
+        offset: int,
+        read_data_cb: Callable[..., Any],
+        file_name: str,
+        *args: Any,
+        **kwargs: Any,
+    ) -> Any:
+        mapping = mmap.mmap(f.fileno(), 0, access=mmap.ACCESS_READ)
+        if hasattr(mmap, "MADV_SEQUENTIAL"):
+            mapping.madvise(mmap.MADV_SEQUENTIAL)
+        view = memoryview(mapping)[offset:]
+        try:
+            return read_data_cb(view, file_name, *args, **kwargs)
+        finally:
+            try:
+                view.release()
+                mapping.close()
+            except BufferError:
+                # The callback still exports the buffer (e.g. np.frombuffer):
+                # the mapping is released once those references are gone
+                pass
@@ -1,5 +1,10 @@
 import importlib.resources as pkg_resources
+from functools import lru_cache
 
+# Resolved once at import instead of on every lookup
+_PKG_ROOT = pkg_resources.files("flim_components")
 
+
+@lru_cache(maxsize=None)
 def get_asset_path(asset_name: str) -> str:
-    return str(pkg_resources.files("flim_components").joinpath(asset_name))
+    return str(_PKG_ROOT.joinpath(asset_name))
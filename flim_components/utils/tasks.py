@@ -1,12 +1,19 @@
+import json
+from typing import Any, Callable
 from PyQt6.QtCore import QRunnable, pyqtSlot, pyqtSignal, QObject
 import matplotlib.pyplot as plt
 
+
 class TaskSignals(QObject):
     """
     Signals for task completion and errors.
+
+    Payloads are passed by reference as Python objects: `success` carries a dict
+    (e.g. {"paths": [...]} for SavePlotImageTask) and `error` the error message
+    (a {"title", "message"} dict for ReadJsonTask).
     """
-    success = pyqtSignal(str)
-    error = pyqtSignal(str)
+    success = pyqtSignal(object)
+    error = pyqtSignal(object)
     
 
 class SavePlotImageTask(QRunnable):
@@ -37,13 +44,55 @@ class SavePlotImageTask(QRunnable):
         Execute the task of saving the plot in specified formats.
         """
         try:
-            for format in self.formats:
-                file_path = f"{self.base_path}.{format}"
-                self.plot.savefig(file_path, format=format)
+            self._save_formats()
             plt.close(self.plot)
             self.signals.success.emit(
-                f"Plot images saved successfully as {', '.join([f'{self.base_path}.{format}' for format in self.formats])}"
+                {"paths": [f"{self.base_path}.{format}" for format in self.formats]}
             )
         except Exception as e:
             plt.close(self.plot)
-            self.signals.error.emit(str(e))
\ No newline at end of file
+            self.signals.error.emit(str(e))
+
+    def _save_formats(self):
+        for format in self.formats:
+            self.plot.savefig(f"{self.base_path}.{format}", format=format)
+
+
+class ReadJsonTask(QRunnable):
+    def __init__(self, file_name: str, signals: TaskSignals, load: Callable[[str], Any]):
+        """
+        Initialize the ReadJsonTask with the file to parse, the signals to notify and the parser.
+
+        Parameters:
+        ----------
+        file_name : str
+            The path of the JSON file to parse.
+        signals : TaskSignals
+            The signals object to emit {"file_name", "data"} on success, or
+            {"title", "message"} on error.
+        load : Callable[[str], Any]
+            Parses the file at the given path (e.g. ReadFilesUtils.load_json_file).
+        """
+        super().__init__()
+        self.file_name = file_name
+        self.signals = signals
+        self.load = load
+
+    @pyqtSlot()
+    def run(self):
+        """
+        Execute the task of parsing the JSON file.
+        """
+        try:
+            data = self.load(self.file_name)
+            self.signals.success.emit({"file_name": self.file_name, "data": data})
+        # orjson.JSONDecodeError subclasses json.JSONDecodeError
+        except json.JSONDecodeError:
+            self.signals.error.emit(
+                {
+                    "title": "Invalid JSON",
+                    "message": "The file could not be parsed as valid JSON.",
+                }
+            )
+        except Exception as e:
+            self.signals.error.emit({"title": "Error reading file", "message": str(e)})